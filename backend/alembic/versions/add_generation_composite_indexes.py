@@ -0,0 +1,51 @@
+"""Add composite and partial indexes on generations
+
+Revision ID: 3b7a9e2f1c64
+Revises: e8f4c2d1a3b5
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7a9e2f1c64'
+down_revision: Union[str, None] = 'e8f4c2d1a3b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_generations_user_status_created',
+            'generations',
+            ['user_id', 'status', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_generations_active',
+            'generations',
+            ['user_id', 'status'],
+            unique=False,
+            postgresql_where=sa.text("status IN ('pending', 'processing')"),
+            postgresql_concurrently=True
+        )
+        # Single-column indexes now covered by ix_generations_user_status_created
+        op.drop_index('ix_generations_user_id', table_name='generations', postgresql_concurrently=True)
+        op.drop_index('ix_generations_status', table_name='generations', postgresql_concurrently=True)
+        op.drop_index('ix_generations_created_at', table_name='generations', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_generations_created_at', 'generations', ['created_at'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_generations_status', 'generations', ['status'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_generations_user_id', 'generations', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_generations_active', table_name='generations', postgresql_concurrently=True)
+        op.drop_index('ix_generations_user_status_created', table_name='generations', postgresql_concurrently=True)
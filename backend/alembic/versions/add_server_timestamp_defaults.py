@@ -0,0 +1,44 @@
+"""Generate created_at/updated_at server-side for generations and subscriptions
+
+Revision ID: 2a6d4c8e0f37
+Revises: 8e1f6b3d9a42
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2a6d4c8e0f37'
+down_revision: Union[str, None] = '8e1f6b3d9a42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ('generations', 'subscriptions')
+COLUMNS = ('created_at', 'updated_at')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        for column in COLUMNS:
+            op.alter_column(
+                table, column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=sa.text("timezone('utc', now())")
+            )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        for column in COLUMNS:
+            op.alter_column(
+                table, column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=None
+            )
@@ -0,0 +1,48 @@
+"""Generate created_at/updated_at server-side for users, websites and tokens
+
+Revision ID: 9b4e6a2c8d13
+Revises: 7f3a1d5c9e26
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4e6a2c8d13'
+down_revision: Union[str, None] = '7f3a1d5c9e26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = (
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('websites', 'created_at'),
+    ('websites', 'updated_at'),
+    ('password_reset_tokens', 'created_at'),
+    ('email_verification_tokens', 'created_at'),
+)
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.text("timezone('utc', now())")
+        )
+
+
+def downgrade() -> None:
+    for table, column in COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None
+        )
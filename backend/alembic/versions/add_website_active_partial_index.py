@@ -0,0 +1,36 @@
+"""Add partial index on active websites (user_id, created_at DESC)
+
+Revision ID: c5f7e9a1b3d8
+Revises: 6a0d3f8b2e41
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f7e9a1b3d8'
+down_revision: Union[str, None] = '6a0d3f8b2e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_websites_active_user_created',
+            'websites',
+            ['user_id', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_websites_active_user_created', table_name='websites', postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""Add composite (user_id, is_active, created_at DESC) index on websites
+
+Revision ID: 7f3a1d5c9e26
+Revises: 4c9e2b7d1f58
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3a1d5c9e26'
+down_revision: Union[str, None] = '4c9e2b7d1f58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_websites_user_active_created',
+            'websites',
+            ['user_id', 'is_active', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        # Single-column index now covered by ix_websites_user_active_created
+        op.drop_index('ix_websites_user_id', table_name='websites', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_websites_user_id', 'websites', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_websites_user_active_created', table_name='websites', postgresql_concurrently=True)
@@ -0,0 +1,114 @@
+"""Convert status and plan columns to native PostgreSQL ENUM types
+
+Revision ID: 8e1f6b3d9a42
+Revises: 5d2c8f4a7b19
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e1f6b3d9a42'
+down_revision: Union[str, None] = '5d2c8f4a7b19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+generation_status = postgresql.ENUM(
+    'pending', 'processing', 'completed', 'failed',
+    name='generation_status'
+)
+plan_type = postgresql.ENUM(
+    'free', 'starter', 'standard', 'pro',
+    name='plan_type'
+)
+subscription_status = postgresql.ENUM(
+    'active', 'trialing', 'past_due', 'canceled', 'incomplete',
+    'incomplete_expired', 'unpaid', 'paused',
+    name='subscription_status'
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    generation_status.create(bind, checkfirst=True)
+    plan_type.create(bind, checkfirst=True)
+    subscription_status.create(bind, checkfirst=True)
+    
+    # The partial index predicate compares status against text literals,
+    # so it has to be rebuilt around the type change
+    op.drop_index('ix_generations_active', table_name='generations')
+    
+    op.alter_column(
+        'generations', 'status',
+        existing_type=sa.String(length=50),
+        type_=generation_status,
+        existing_nullable=False,
+        postgresql_using='status::generation_status'
+    )
+    op.alter_column(
+        'subscriptions', 'plan_type',
+        existing_type=sa.String(length=50),
+        type_=plan_type,
+        existing_nullable=False,
+        postgresql_using='plan_type::plan_type'
+    )
+    op.alter_column(
+        'subscriptions', 'status',
+        existing_type=sa.String(length=50),
+        type_=subscription_status,
+        existing_nullable=False,
+        postgresql_using='status::subscription_status'
+    )
+    
+    op.create_index(
+        'ix_generations_active',
+        'generations',
+        ['user_id', 'status'],
+        unique=False,
+        postgresql_where=sa.text("status IN ('pending', 'processing')")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_generations_active', table_name='generations')
+    
+    op.alter_column(
+        'subscriptions', 'status',
+        existing_type=subscription_status,
+        type_=sa.String(length=50),
+        existing_nullable=False,
+        postgresql_using='status::text'
+    )
+    op.alter_column(
+        'subscriptions', 'plan_type',
+        existing_type=plan_type,
+        type_=sa.String(length=50),
+        existing_nullable=False,
+        postgresql_using='plan_type::text'
+    )
+    op.alter_column(
+        'generations', 'status',
+        existing_type=generation_status,
+        type_=sa.String(length=50),
+        existing_nullable=False,
+        postgresql_using='status::text'
+    )
+    
+    op.create_index(
+        'ix_generations_active',
+        'generations',
+        ['user_id', 'status'],
+        unique=False,
+        postgresql_where=sa.text("status IN ('pending', 'processing')")
+    )
+    
+    bind = op.get_bind()
+    subscription_status.drop(bind, checkfirst=True)
+    plan_type.drop(bind, checkfirst=True)
+    generation_status.drop(bind, checkfirst=True)
@@ -0,0 +1,43 @@
+"""Store websites.is_active and websites.use_playwright as native booleans
+
+Revision ID: 4c9e2b7d1f58
+Revises: 2a6d4c8e0f37
+Create Date: 2026-10-16 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c9e2b7d1f58'
+down_revision: Union[str, None] = '2a6d4c8e0f37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = ('is_active', 'use_playwright')
+
+
+def upgrade() -> None:
+    for column in COLUMNS:
+        op.alter_column(
+            'websites', column,
+            existing_type=sa.Integer(),
+            type_=sa.Boolean(),
+            existing_nullable=False,
+            postgresql_using=f'{column} <> 0'
+        )
+
+
+def downgrade() -> None:
+    for column in COLUMNS:
+        op.alter_column(
+            'websites', column,
+            existing_type=sa.Boolean(),
+            type_=sa.Integer(),
+            existing_nullable=False,
+            postgresql_using=f'{column}::integer'
+        )
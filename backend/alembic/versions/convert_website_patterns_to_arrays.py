@@ -0,0 +1,53 @@
+"""Store website include/exclude patterns as text arrays
+
+Revision ID: 1e8c5a3f7b92
+Revises: 9b4e6a2c8d13
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1e8c5a3f7b92'
+down_revision: Union[str, None] = '9b4e6a2c8d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = ('include_patterns', 'exclude_patterns')
+
+
+def upgrade() -> None:
+    for column in COLUMNS:
+        # Stored values were already normalized to "a,b,c" by the API
+        op.alter_column(
+            'websites', column,
+            existing_type=sa.Text(),
+            type_=postgresql.ARRAY(sa.String()),
+            existing_nullable=True,
+            postgresql_using=f"CASE WHEN {column} IS NULL OR {column} = '' THEN NULL ELSE string_to_array({column}, ',') END"
+        )
+    op.create_index(
+        'ix_websites_include_patterns_gin',
+        'websites',
+        ['include_patterns'],
+        unique=False,
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_websites_include_patterns_gin', table_name='websites')
+    for column in COLUMNS:
+        op.alter_column(
+            'websites', column,
+            existing_type=postgresql.ARRAY(sa.String()),
+            type_=sa.Text(),
+            existing_nullable=True,
+            postgresql_using=f"array_to_string({column}, ',')"
+        )
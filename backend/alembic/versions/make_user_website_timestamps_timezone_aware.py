@@ -0,0 +1,54 @@
+"""Make users and websites timestamps timezone-aware (timestamptz)
+
+Revision ID: 6a0d3f8b2e41
+Revises: 1e8c5a3f7b92
+Create Date: 2026-10-16 13:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a0d3f8b2e41'
+down_revision: Union[str, None] = '1e8c5a3f7b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, nullable, has server default)
+COLUMNS = (
+    ('users', 'created_at', False, True),
+    ('users', 'updated_at', False, True),
+    ('users', 'last_login_at', True, False),
+    ('websites', 'created_at', False, True),
+    ('websites', 'updated_at', False, True),
+    ('websites', 'last_generated_at', True, False),
+)
+
+
+def upgrade() -> None:
+    # Existing values were written as naive UTC
+    for table, column, nullable, has_default in COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.DateTime(),
+            type_=sa.DateTime(timezone=True),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            **({'server_default': sa.text('now()')} if has_default else {})
+        )
+
+
+def downgrade() -> None:
+    for table, column, nullable, has_default in COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.DateTime(timezone=True),
+            type_=sa.DateTime(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            **({'server_default': sa.text("timezone('utc', now())")} if has_default else {})
+        )
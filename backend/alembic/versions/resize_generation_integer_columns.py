@@ -0,0 +1,74 @@
+"""Right-size integer columns on generations
+
+Revision ID: 5d2c8f4a7b19
+Revises: 3b7a9e2f1c64
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2c8f4a7b19'
+down_revision: Union[str, None] = '3b7a9e2f1c64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 0-100 and small retry counters fit in 2 bytes
+    op.alter_column(
+        'generations', 'progress_percentage',
+        existing_type=sa.Integer(),
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using='progress_percentage::smallint'
+    )
+    op.alter_column(
+        'generations', 'retry_count',
+        existing_type=sa.Integer(),
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using='retry_count::smallint'
+    )
+    # ZIP archives can exceed the 2 GB range of a 4-byte integer
+    op.alter_column(
+        'generations', 'file_size',
+        existing_type=sa.Integer(),
+        type_=sa.BigInteger(),
+        existing_nullable=True,
+        postgresql_using='file_size::bigint'
+    )
+    op.create_check_constraint(
+        'ck_generations_progress_percentage',
+        'generations',
+        'progress_percentage BETWEEN 0 AND 100'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_generations_progress_percentage', 'generations', type_='check')
+    op.alter_column(
+        'generations', 'file_size',
+        existing_type=sa.BigInteger(),
+        type_=sa.Integer(),
+        existing_nullable=True,
+        postgresql_using='file_size::integer'
+    )
+    op.alter_column(
+        'generations', 'retry_count',
+        existing_type=sa.SmallInteger(),
+        type_=sa.Integer(),
+        existing_nullable=False,
+        postgresql_using='retry_count::integer'
+    )
+    op.alter_column(
+        'generations', 'progress_percentage',
+        existing_type=sa.SmallInteger(),
+        type_=sa.Integer(),
+        existing_nullable=False,
+        postgresql_using='progress_percentage::integer'
+    )
@@ -0,0 +1,85 @@
+"""
+Lazy router registration.
+Defers importing rarely-used API modules until their prefix is first requested.
+"""
+import importlib
+import logging
+from typing import Any
+
+from fastapi import FastAPI
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import Receive, Scope, Send
+
+
+logger = logging.getLogger(__name__)
+
+
+class LazyRouter(BaseRoute):
+    """
+    Placeholder route standing in for an APIRouter that hasn't been imported yet.
+
+    It matches every path under `path_prefix`. On the first match (or when
+    the OpenAPI schema is built) it imports `module`, includes its router
+    into the app exactly like `app.include_router(...)` would, and splices
+    the resulting routes into the route table in its own place. After that
+    requests hit the real routes directly and this object is no longer
+    consulted.
+    """
+
+    def __init__(
+        self,
+        app: FastAPI,
+        module: str,
+        path_prefix: str,
+        attr: str = "router",
+        **include_kwargs: Any
+    ) -> None:
+        self.app = app
+        self.module = module
+        self.path_prefix = path_prefix.rstrip("/")
+        self.attr = attr
+        self.include_kwargs = include_kwargs
+        self._loaded = False
+
+    def matches(self, scope: Scope):
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path == self.path_prefix or path.startswith(self.path_prefix + "/"):
+                return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, **path_params: Any):
+        # Only reachable before loading; loaded routes answer for themselves
+        raise NoMatchFound(name, path_params)
+
+    def load(self) -> None:
+        """Import the module and replace this placeholder with its routes."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        routes = self.app.router.routes
+        router = getattr(importlib.import_module(self.module), self.attr)
+
+        # Let FastAPI build the routes as usual (they are appended at the end),
+        # then move them to where this placeholder sits to keep match order
+        first_new = len(routes)
+        self.app.include_router(router, **self.include_kwargs)
+        new_routes = routes[first_new:]
+        del routes[first_new:]
+
+        index = routes.index(self)
+        routes[index:index + 1] = new_routes
+        logger.info(f"Lazily loaded router {self.module} ({len(new_routes)} routes)")
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.load()
+        # Re-dispatch through the app router, which now holds the real routes
+        await self.app.router(scope, receive, send)
+
+
+def load_lazy_routers(app: FastAPI) -> None:
+    """Load every pending LazyRouter (e.g. before generating the OpenAPI schema)."""
+    for route in list(app.router.routes):
+        if isinstance(route, LazyRouter):
+            route.load()
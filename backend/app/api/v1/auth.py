@@ -2,7 +2,7 @@
 Authentication API endpoints.
 Handles user registration, login, token refresh, and logout.
 """
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
@@ -33,7 +33,6 @@ from app.schemas.auth import (
     ErrorResponse
 )
 from app.api.dependencies import get_current_user, verify_refresh_token
-from app.services.email import email_service
 
 
 router = APIRouter()
@@ -118,8 +117,11 @@ async def register(
     db.add(email_verification)
     db.commit()
     
-    # Send verification email (async, don't wait for completion)
-    await email_service.send_verification_email(
+    # Queue verification email (sent by a Celery worker, not awaited here)
+    # (imported per request so loading this router doesn't pull in Celery)
+    from app.tasks.email import queue_email
+    await queue_email(
+        "verification",
         to_email=new_user.email,
         token=verification_token,
         user_name=new_user.full_name
@@ -194,7 +196,7 @@ async def login(
         )
     
     # Update last login timestamp
-    user.last_login_at = datetime.utcnow()
+    user.last_login_at = datetime.now(timezone.utc)
     db.commit()
     
     # Create tokens
@@ -400,7 +402,6 @@ async def change_password(
     
     # Update password
     current_user.password_hash = hash_password(new_password)
-    current_user.updated_at = datetime.utcnow()
     db.commit()
     
     return {
@@ -4,7 +4,7 @@ Contact form API endpoint.
 from fastapi import APIRouter, HTTPException, status, Request
 from pydantic import BaseModel, EmailStr, Field
 from app.core.rate_limit import limiter
-from app.services.email import email_service
+from app.services.email import email_service, schedule_email
 
 router = APIRouter(prefix="/contact", tags=["Contact"])
 
@@ -28,13 +28,14 @@ async def send_contact_message(
     Rate limited to 3 messages per hour per IP.
     """
     try:
-        # Send email to support
-        await email_service.send_contact_form_email(
+        # Send email to support in the background; SendGrid failures are
+        # logged by the email service rather than surfaced here
+        schedule_email(email_service.send_contact_form_email(
             from_name=data.name,
             from_email=data.email,
             subject=data.subject,
             message=data.message
-        )
+        ))
         
         return {
             "message": "Message sent successfully",
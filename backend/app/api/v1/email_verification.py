@@ -18,7 +18,6 @@ from app.schemas.auth import (
     ErrorResponse
 )
 from app.api.dependencies import get_current_user
-from app.services.email import email_service
 
 
 router = APIRouter()
@@ -83,7 +82,6 @@ async def verify_email(
     
     # Mark user as verified
     user.is_verified = True
-    user.updated_at = datetime.utcnow()
     
     # Mark token as used
     verification_token.is_used = True
@@ -168,7 +166,10 @@ async def resend_verification_email(
     db.commit()
     
     # Send verification email
-    email_sent = await email_service.send_verification_email(
+    # (imported per request so loading this router doesn't pull in Celery)
+    from app.tasks.email import queue_email
+    email_sent = await queue_email(
+        "verification",
         to_email=user.email,
         token=verification_token,
         user_name=user.full_name
@@ -239,7 +240,10 @@ async def resend_verification_email_authenticated(
     db.commit()
     
     # Send verification email
-    email_sent = await email_service.send_verification_email(
+    # (imported per request so loading this router doesn't pull in Celery)
+    from app.tasks.email import queue_email
+    email_sent = await queue_email(
+        "verification",
         to_email=current_user.email,
         token=verification_token,
         user_name=current_user.full_name
@@ -4,16 +4,16 @@ Generation API endpoints for starting, tracking, and downloading content generat
 from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from sqlalchemy import select, func, desc
 from sqlalchemy.orm import Session
 import os
-import math
 
 from app.core.database import get_db
+from app.utils.pagination import page_count
 from app.api.dependencies import get_current_active_user
 from app.models.user import User
-from app.models.generation import Generation
+from app.models.generation import Generation, GENERATION_STATUSES
 from app.models.website import Website
 from app.services.subscription import SubscriptionService
 from app.schemas.generation import (
@@ -52,7 +52,7 @@ def start_generation(
         raise HTTPException(status_code=404, detail="Website not found")
     
     # Check if website is active
-    if not website.is_active_bool:
+    if not website.is_active:
         raise HTTPException(status_code=400, detail="Website is not active")
     
     # Check generation quota
@@ -67,7 +67,7 @@ def start_generation(
     # Check if there's already a pending/processing generation for this website
     existing = db.query(Generation).filter(
         Generation.website_id == data.website_id,
-        Generation.status.in_(['pending', 'processing'])
+        Generation.is_in_progress
     ).first()
     
     if existing:
@@ -118,7 +118,7 @@ def check_generation_quota(
         raise HTTPException(status_code=404, detail="No subscription found")
     
     can_generate = subscription_service.check_generation_quota(current_user.id)
-    remaining = max(0, subscription.generations_limit - subscription.generations_used)
+    remaining = subscription.remaining_generations
     
     message = (
         f"You have {remaining} generation{'s' if remaining != 1 else ''} remaining this month."
@@ -135,7 +135,9 @@ def check_generation_quota(
     )
 
 
-@router.get("/history", response_model=GenerationListResponse)
+# Items are validated from the ORM rows once; response_model=None skips
+# FastAPI's second validation pass over the whole list
+@router.get("/history", response_model=None, responses={200: {"model": GenerationListResponse}})
 def get_generation_history(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -157,7 +159,7 @@ def get_generation_history(
         query = query.filter(Generation.website_id == website_id)
     
     if status:
-        if status not in ['pending', 'processing', 'completed', 'failed']:
+        if status not in GENERATION_STATUSES:
             raise HTTPException(status_code=400, detail="Invalid status filter")
         query = query.filter(Generation.status == status)
     
@@ -165,7 +167,7 @@ def get_generation_history(
     total = query.count()
     
     # Calculate pagination
-    total_pages = math.ceil(total / per_page) if total > 0 else 1
+    total_pages = page_count(total, per_page)
     
     if page > total_pages and total > 0:
         raise HTTPException(status_code=404, detail="Page not found")
@@ -177,22 +179,24 @@ def get_generation_history(
     # Add recommendations and website info for completed generations
     items = []
     for generation, website in results:
-        gen_dict = GenerationResponse.model_validate(generation).model_dump()
-        gen_dict['website_name'] = website.name
-        gen_dict['website_url'] = website.url
+        extra = {
+            'website_name': website.name,
+            'website_url': website.url,
+        }
         
         if generation.status == 'completed' and generation.total_pages and generation.file_size:
             recommendation = get_file_recommendation(generation.total_pages, generation.file_size)
-            gen_dict['recommendation'] = FileRecommendation(**recommendation)
-        items.append(GenerationResponse(**gen_dict))
+            extra['recommendation'] = FileRecommendation(**recommendation)
+        items.append(GenerationResponse.model_validate(generation).model_copy(update=extra))
     
-    return GenerationListResponse(
+    result = GenerationListResponse.model_construct(
         items=items,
         total=total,
         page=page,
         per_page=per_page,
         pages=total_pages
     )
+    return ORJSONResponse(result.model_dump(mode="json"))
 
 
 @router.get("/{generation_id}", response_model=GenerationStatusResponse)
@@ -309,7 +313,7 @@ def delete_generation(
         raise HTTPException(status_code=404, detail="Generation not found")
     
     # Don't allow deletion of pending/processing generations
-    if generation.status in ['pending', 'processing']:
+    if generation.is_in_progress:
         raise HTTPException(
             status_code=400,
             detail="Cannot delete a generation that is in progress"
@@ -19,7 +19,6 @@ from app.schemas.auth import (
     MessageResponse,
     ErrorResponse
 )
-from app.services.email import email_service
 
 
 router = APIRouter()
@@ -92,7 +91,10 @@ async def request_password_reset(
     db.commit()
     
     # Send password reset email
-    email_sent = await email_service.send_password_reset_email(
+    # (imported per request so loading this router doesn't pull in Celery)
+    from app.tasks.email import queue_email
+    email_sent = await queue_email(
+        "password_reset",
         to_email=user.email,
         token=reset_token,
         user_name=user.full_name
@@ -171,7 +173,6 @@ async def confirm_password_reset(
     
     # Update user password
     user.password_hash = hash_password(reset_confirm.new_password)
-    user.updated_at = datetime.utcnow()
     
     # Mark token as used
     password_reset.is_used = True
@@ -10,7 +10,7 @@ from app.api.dependencies import get_current_active_user
 from app.models.user import User
 from app.services.refund import RefundService
 from app.services.subscription import SubscriptionService
-from app.services.email import email_service
+from app.services.email import email_service, schedule_email
 
 router = APIRouter(prefix="/refunds", tags=["Refunds"])
 
@@ -172,14 +172,14 @@ async def cancel_subscription_with_cooling_off(
             request.reason
         )
         
-        # Send refund confirmation email
-        await email_service.send_cooling_off_refund_email(
+        # Send refund confirmation email without holding up the response
+        schedule_email(email_service.send_cooling_off_refund_email(
             to_email=current_user.email,
             user_name=current_user.full_name,
             refund_amount=result['refund_amount'],
             usage_charge=result['usage_charge'],
             generations_used=result['generations_used']
-        )
+        ))
         
         return CancellationResponse(
             canceled=True,
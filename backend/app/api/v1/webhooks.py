@@ -18,15 +18,7 @@ from app.models.subscription import Subscription
 from app.models.stripe_event import StripeEvent
 from app.core.subscription_plans import get_plan_limits
 from app.services.subscription import SubscriptionService
-from app.services.email import (
-    send_payment_success_email,
-    send_subscription_payment_email,
-    send_payment_failed_email,
-    send_chargeback_email,
-    send_refund_email,
-    send_payment_action_required_email,
-    send_subscription_canceled_email
-)
+from app.tasks.email import enqueue_email
 from app.core.subscription_plans import PLAN_FEATURES
 
 # Configure Stripe
@@ -373,7 +365,7 @@ def handle_subscription_deleted(
     # Send cancellation email
     if user:
         try:
-            send_subscription_canceled_email(user.email, user.full_name)
+            enqueue_email("subscription_canceled", to_email=user.email, user_name=user.full_name)
         except Exception as e:
             logger.error(f"Failed to send cancellation email: {e}")
 
@@ -410,7 +402,7 @@ def handle_payment_failed(
     user = db.query(User).filter(User.id == subscription.user_id).first()
     if user:
         try:
-            send_payment_failed_email(user.email, user.full_name)
+            enqueue_email("payment_failed", to_email=user.email, user_name=user.full_name)
         except Exception as e:
             logger.error(f"Failed to send payment failed email: {e}")
 
@@ -448,9 +440,14 @@ def handle_payment_succeeded(event_data: Dict[str, Any], db: Session) -> None:
                     
                     # Format next billing date
                     next_billing = subscription.current_period_end.strftime('%B %d, %Y') if subscription.current_period_end else "N/A"
-                    
+                except Exception as e:
+                    logger.error(f"Failed to load subscription details for payment email: {e}")
+                    # Fall back to the basic email without plan details
+                    enqueue_email("payment_success", to_email=user.email, amount_paid=amount_paid, user_name=user.full_name)
+                else:
                     # Send detailed email
-                    send_subscription_payment_email(
+                    enqueue_email(
+                        "subscription_payment",
                         to_email=user.email,
                         user_name=user.full_name,
                         plan_name=plan_name,
@@ -459,13 +456,6 @@ def handle_payment_succeeded(event_data: Dict[str, Any], db: Session) -> None:
                         next_billing_date=next_billing,
                         features=features
                     )
-                except Exception as e:
-                    logger.error(f"Failed to send detailed payment email: {e}")
-                    # Fallback to basic email
-                    try:
-                        send_payment_success_email(user.email, amount_paid, user.full_name)
-                    except Exception as e2:
-                        logger.error(f"Failed to send fallback payment email: {e2}")
     
     logger.info(f"Payment succeeded for subscription {subscription_id}: €{amount_paid}")
 
@@ -496,7 +486,7 @@ def handle_charge_disputed(event_data: Dict[str, Any], db: Session) -> None:
         user = db.query(User).filter(User.id == subscription.user_id).first()
         if user:
             try:
-                send_chargeback_email(user.email, user.full_name)
+                enqueue_email("chargeback", to_email=user.email, user_name=user.full_name)
             except Exception as e:
                 logger.error(f"Failed to send chargeback email: {e}")
 
@@ -528,7 +518,7 @@ def handle_charge_refunded(event_data: Dict[str, Any], db: Session) -> None:
             user = db.query(User).filter(User.id == subscription.user_id).first()
             if user:
                 try:
-                    send_refund_email(user.email, amount_refunded, user.full_name)
+                    enqueue_email("refund", to_email=user.email, amount_refunded=amount_refunded, user_name=user.full_name)
                 except Exception as e:
                     logger.error(f"Failed to send refund email: {e}")
 
@@ -548,7 +538,7 @@ def handle_payment_action_required(event_data: Dict[str, Any], db: Session) -> N
         user = db.query(User).filter(User.id == subscription.user_id).first()
         if user and hosted_invoice_url:
             try:
-                send_payment_action_required_email(user.email, hosted_invoice_url, user.full_name)
+                enqueue_email("payment_action_required", to_email=user.email, hosted_invoice_url=hosted_invoice_url, user_name=user.full_name)
             except Exception as e:
                 logger.error(f"Failed to send payment action required email: {e}")
 
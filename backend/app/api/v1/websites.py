@@ -5,12 +5,13 @@ Includes CRUD operations, statistics, and plan-based limits.
 from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select, func, desc, and_
 from sqlalchemy.orm import Session
-import math
 from datetime import datetime, timedelta
 
 from app.core.database import get_db
+from app.utils.pagination import page_count
 from app.api.dependencies import get_current_active_user
 from app.models.user import User
 from app.models.website import Website
@@ -92,9 +93,9 @@ def create_website(
         include_patterns=data.include_patterns,
         exclude_patterns=data.exclude_patterns,
         max_pages=data.max_pages,
-        use_playwright=1 if data.use_playwright else 0,
+        use_playwright=data.use_playwright,
         timeout=data.timeout,
-        is_active=1 if data.is_active else 0
+        is_active=data.is_active
     )
     
     db.add(website)
@@ -108,7 +109,9 @@ def create_website(
     return website
 
 
-@router.get("", response_model=WebsiteListResponse)
+# Items are validated from the ORM rows once; response_model=None skips
+# FastAPI's second validation pass over the whole list
+@router.get("", response_model=None, responses={200: {"model": WebsiteListResponse}})
 def list_websites(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -124,13 +127,13 @@ def list_websites(
     
     # Apply filters
     if is_active is not None:
-        query = query.filter(Website.is_active == (1 if is_active else 0))
+        query = query.filter(Website.is_active == is_active)
     
     # Get total count
     total = query.count()
     
     # Calculate pagination
-    total_pages = math.ceil(total / per_page) if total > 0 else 1
+    total_pages = page_count(total, per_page)
     
     if page > total_pages and total > 0:
         raise HTTPException(status_code=404, detail="Page not found")
@@ -139,13 +142,14 @@ def list_websites(
     offset = (page - 1) * per_page
     websites = query.order_by(desc(Website.created_at)).offset(offset).limit(per_page).all()
     
-    return WebsiteListResponse(
+    result = WebsiteListResponse.model_construct(
         items=[WebsiteResponse.model_validate(w) for w in websites],
         total=total,
         page=page,
         per_page=per_page,
         pages=total_pages
     )
+    return ORJSONResponse(result.model_dump(mode="json"))
 
 
 @router.get("/{website_id}", response_model=WebsiteResponse)
@@ -200,13 +204,6 @@ def update_website(
         if update_data['max_pages'] > max_pages_limit:
             update_data['max_pages'] = max_pages_limit
     
-    # Handle boolean conversion for use_playwright and is_active
-    if 'use_playwright' in update_data:
-        update_data['use_playwright'] = 1 if update_data['use_playwright'] else 0
-    
-    if 'is_active' in update_data:
-        update_data['is_active'] = 1 if update_data['is_active'] else 0
-    
     # Check for duplicate URL if URL is being changed
     if 'url' in update_data and update_data['url'] != website.url:
         existing = db.query(Website).filter(
@@ -225,8 +222,6 @@ def update_website(
     for key, value in update_data.items():
         setattr(website, key, value)
     
-    website.updated_at = datetime.utcnow()
-    
     db.commit()
     db.refresh(website)
     
@@ -253,7 +248,7 @@ def delete_website(
     # Check if there are any pending/processing generations
     active_generations = db.query(Generation).filter(
         Generation.website_id == website_id,
-        Generation.status.in_(['pending', 'processing'])
+        Generation.is_in_progress
     ).first()
     
     if active_generations:
@@ -370,7 +365,7 @@ def get_user_stats(
     
     active_websites = db.query(func.count(Website.id)).filter(
         Website.user_id == current_user.id,
-        Website.is_active == 1
+        Website.is_active.is_(True)
     ).scalar() or 0
     
     # Generation counts
@@ -403,7 +398,7 @@ def get_user_stats(
         ).scalar() or 0
     
     # Remaining generations
-    generations_remaining = max(0, subscription.generations_limit - subscription.generations_used)
+    generations_remaining = subscription.remaining_generations
     
     # Success rate
     success_rate = (successful_generations / total_generations * 100) if total_generations > 0 else 0.0
@@ -11,7 +11,7 @@ celery_app = Celery(
     'llmready',
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
-    include=['app.tasks.generation', 'app.tasks.scheduled']
+    include=['app.tasks.generation', 'app.tasks.scheduled', 'app.tasks.email']
 )
 
 # Celery Configuration
@@ -59,4 +59,5 @@ celery_app.conf.update(
 celery_app.conf.task_routes = {
     'app.tasks.generation.*': {'queue': 'generation'},
     'app.tasks.scheduled.*': {'queue': 'scheduled'},
+    'app.tasks.email.*': {'queue': 'email'},
 }
\ No newline at end of file
@@ -3,8 +3,7 @@ Database configuration and session management.
 Sets up SQLAlchemy engine, session factory, and base model.
 """
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
 from typing import Generator
 
 from app.core.config import settings
@@ -15,7 +14,10 @@ engine = create_engine(
     echo=settings.DATABASE_ECHO,
     pool_pre_ping=True,  # Verify connections before using
     pool_size=10,
-    max_overflow=20
+    max_overflow=20,
+    # Batch executemany INSERTs into multi-row VALUES and UPDATE/DELETEs
+    # into execute_batch pages instead of one roundtrip per row (psycopg2)
+    executemany_mode="values_plus_batch"
 )
 
 # Create session factory
@@ -25,8 +27,15 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
-# Base class for all models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """
+    Base class for all models.
+    
+    eager_defaults makes INSERT/UPDATE fetch server-generated columns
+    (timestamps) in the same statement via RETURNING, instead of expiring
+    them and issuing a follow-up SELECT on next access.
+    """
+    __mapper_args__ = {"eager_defaults": True}
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -0,0 +1,135 @@
+"""
+Edge middleware: the single outermost layer that decorates every response.
+Combines security headers, CORS and an X-Response-Time header in one pass.
+"""
+import time
+from typing import Final, FrozenSet, Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.security_middleware import SECURITY_HEADERS
+
+
+# Preflight responses may be cached by browsers for 24h
+CORS_MAX_AGE: Final = 86400
+
+_PREFLIGHT_FAILED_BODY: Final = b"Disallowed CORS origin, method or headers"
+
+# Responses differ by Origin whenever the allow-list is explicit, so shared
+# caches must key on it even when this request's origin was rejected
+_VARY_ORIGIN: Final = (b"vary", b"Origin")
+
+
+class EdgeMiddleware:
+    """
+    Pure ASGI middleware handling both CORS and the security headers.
+
+    - Answers CORS preflights directly (explicit methods/headers, max-age).
+    - On every http.response.start, appends in a single header-list copy:
+      the precomputed security headers, the CORS echo headers when the
+      request Origin is allowed (Vary: Origin on every response when the
+      allow-list is explicit), and X-Response-Time in milliseconds.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Iterable[str],
+        allow_methods: Iterable[str],
+        allow_headers: Iterable[str],
+        max_age: int = CORS_MAX_AGE,
+    ) -> None:
+        self.app = app
+        origins = frozenset(allow_origins)
+        self.allow_all_origins = "*" in origins
+        self.allow_origins: FrozenSet[str] = origins
+        self.allow_methods: FrozenSet[str] = frozenset(m.upper() for m in allow_methods)
+        self.allow_headers: FrozenSet[str] = frozenset(h.lower() for h in allow_headers)
+
+        # Preflight headers that don't depend on the request, encoded once
+        self._preflight_headers: Tuple[Tuple[bytes, bytes], ...] = (
+            (b"access-control-allow-methods", ", ".join(sorted(self.allow_methods)).encode("latin-1")),
+            (b"access-control-allow-headers", ", ".join(sorted(self.allow_headers)).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        )
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        return self.allow_all_origins or origin in self.allow_origins
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value.decode("latin-1")
+            elif name == b"access-control-request-method":
+                request_method = value.decode("latin-1")
+            elif name == b"access-control-request-headers":
+                request_headers = value.decode("latin-1")
+
+        cors_headers: List[Tuple[bytes, bytes]] = []
+        if origin is not None and self.is_allowed_origin(origin):
+            cors_headers = [
+                (b"access-control-allow-origin", origin.encode("latin-1")),
+                (b"access-control-allow-credentials", b"true"),
+                _VARY_ORIGIN,
+            ]
+        elif not self.allow_all_origins:
+            cors_headers = [_VARY_ORIGIN]
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    *SECURITY_HEADERS,
+                    *cors_headers,
+                    (b"x-response-time", f"{elapsed_ms:.2f}ms".encode("latin-1")),
+                ]
+            await send(message)
+
+        if scope["method"] == "OPTIONS" and origin is not None and request_method is not None:
+            await self._preflight(send_wrapper, origin, request_method, request_headers)
+            return
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _preflight(
+        self,
+        send: Send,
+        origin: str,
+        request_method: str,
+        request_headers: Optional[str] = None,
+    ) -> None:
+        """Answer a CORS preflight request without reaching the app."""
+        allowed = (
+            self.is_allowed_origin(origin)
+            and request_method.upper() in self.allow_methods
+            and all(
+                h.strip().lower() in self.allow_headers
+                for h in (request_headers or "").split(",")
+                if h.strip()
+            )
+        )
+
+        if allowed:
+            status, body = 200, b"OK"
+            # CORS echo headers are added by the send wrapper
+            headers = list(self._preflight_headers)
+        else:
+            status, body = 400, _PREFLIGHT_FAILED_BODY
+            headers = []
+
+        headers += [
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,124 @@
+"""
+Error boundary middleware for unhandled exceptions.
+Reports errors to Sentry (throttled per exception type) and returns a JSON 500.
+"""
+import json
+import logging
+import time
+from collections import defaultdict, deque
+from typing import Deque, Dict, Final, List, Tuple
+
+import sentry_sdk
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+# Maximum Sentry captures per exception type per minute
+SENTRY_CAPTURES_PER_MINUTE: Final = 10
+
+# Pre-encoded production error response (DEBUG off never echoes exception text)
+_ERR_BODY_PROD: Final = b'{"detail":"Internal server error","error":"An unexpected error occurred"}'
+_ERR_HEADERS_PROD: Final[Tuple[Tuple[bytes, bytes], ...]] = (
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_ERR_BODY_PROD)).encode("latin-1")),
+)
+
+
+class _CaptureThrottle:
+    """Sliding-window counter limiting how often each key may be reported."""
+
+    def __init__(self, limit: int, window_seconds: float = 60.0) -> None:
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._events: Dict[str, Deque[float]] = defaultdict(deque)
+
+    def allow(self, key: str) -> bool:
+        """Record an event for key and return whether it is within the limit."""
+        now = time.monotonic()
+        events = self._events[key]
+        while events and now - events[0] >= self.window_seconds:
+            events.popleft()
+        if len(events) >= self.limit:
+            return False
+        events.append(now)
+        return True
+
+
+class ErrorBoundaryMiddleware:
+    """
+    Pure ASGI error boundary replacing the global Exception handler.
+
+    - Unhandled exceptions are sent to Sentry at most
+      SENTRY_CAPTURES_PER_MINUTE times per exception type, so scanner
+      floods that trigger 500s can't exhaust the Sentry quota or stall
+      workers serializing tracebacks.
+    - With DEBUG off the 500 body is a pre-encoded constant; only DEBUG
+      mode includes the exception text.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._throttle = _CaptureThrottle(SENTRY_CAPTURES_PER_MINUTE)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            self._report(scope, exc)
+            if response_started:
+                # Too late to send a clean 500; let the server drop the connection
+                raise
+            await self._send_error_response(send, exc)
+
+    def _report(self, scope: Scope, exc: Exception) -> None:
+        """Log the exception and capture it in Sentry, subject to throttling."""
+        client = scope.get("client")
+        extra = {
+            "path": scope.get("path"),
+            "method": scope.get("method"),
+            "client_host": client[0] if client else None,
+        }
+
+        if not self._throttle.allow(type(exc).__qualname__):
+            # Over budget: keep a one-line log, skip traceback and Sentry
+            logger.error("Unhandled exception (throttled): %r", exc, extra=extra)
+            return
+
+        if settings.SENTRY_DSN:
+            sentry_sdk.capture_exception(exc)
+
+        logger.error(f"Unhandled exception: {exc}", exc_info=exc, extra=extra)
+
+    @staticmethod
+    async def _send_error_response(send: Send, exc: Exception) -> None:
+        """Send the JSON 500 response."""
+        if settings.DEBUG:
+            body = json.dumps({
+                "detail": "Internal server error",
+                "error": str(exc)
+            }).encode("utf-8")
+            headers: List[Tuple[bytes, bytes]] = [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ]
+        else:
+            body = _ERR_BODY_PROD
+            headers = list(_ERR_HEADERS_PROD)
+
+        await send({"type": "http.response.start", "status": 500, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
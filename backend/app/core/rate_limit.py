@@ -1,14 +1,27 @@
 """
-Rate limiting configuration using SlowAPI.
-Protects authentication endpoints from brute force attacks.
+Rate limiting configuration.
+SlowAPI protects individual endpoints (e.g. authentication) from brute force
+attacks; RateLimitMiddleware enforces a global per-IP limit on write
+requests through Redis.
 """
+import logging
+import time
+from collections import OrderedDict
+from typing import Final, Optional
+
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
+from redis.exceptions import NoScriptError, RedisError
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
 
 
+logger = logging.getLogger(__name__)
+
 # Initialize rate limiter
 limiter = Limiter(
     key_func=get_remote_address,
@@ -16,6 +29,36 @@ limiter = Limiter(
     storage_uri="memory://",  # Use in-memory storage for MVP (can switch to Redis later)
 )
 
+# Fixed-window counter: INCR and EXPIRE run atomically in one roundtrip,
+# and the TTL is only set when the window's key is created
+RATE_LIMIT_SCRIPT: Final = (
+    "local c=redis.call('INCR',KEYS[1]); "
+    "if c==1 then redis.call('EXPIRE',KEYS[1],ARGV[1]) end; "
+    "return c"
+)
+RATE_LIMIT_WINDOW_SECONDS: Final = 60
+
+# Socket timeouts for the limiter's Redis client: a hung Redis must fail
+# open quickly instead of stalling every request
+RATE_LIMIT_REDIS_TIMEOUT_SECONDS: Final = 0.1
+
+# Minimum seconds between "Redis unavailable" warnings while it is down
+REDIS_WARNING_INTERVAL_SECONDS: Final = 60
+
+# Maximum number of blocked IPs remembered locally by each worker
+BLOCK_CACHE_SIZE: Final = 4096
+
+# Methods left out of the global limit: the SPA polls GET routes (profile,
+# generation status) every few seconds, and users behind a shared NAT share
+# one counter, so only writes count towards RATE_LIMIT_PER_MINUTE
+_UNLIMITED_METHODS: Final = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Paths with their own limits (health) or that must never be throttled (Stripe)
+_EXEMPT_PATHS: Final = frozenset({
+    "/health",
+    f"{settings.API_V1_PREFIX}/webhooks/stripe",
+})
+
 
 def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> Response:
     """
@@ -35,4 +78,99 @@ def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> Res
             "error_code": "RATE_LIMIT_EXCEEDED",
             "retry_after": str(exc.detail).split("Retry after ")[1] if "Retry after" in str(exc.detail) else "60 seconds"
         }
-    )
\ No newline at end of file
+    )
+
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI global rate limit: RATE_LIMIT_PER_MINUTE write requests
+    (anything but GET, HEAD and OPTIONS) per client IP.
+
+    Each request costs a single EVALSHA of RATE_LIMIT_SCRIPT against the
+    app's Redis client (app.state.redis, script SHA in app.state.rl_sha,
+    both set up in the lifespan). The limiter fails open: if Redis is
+    unavailable requests are let through rather than rejected.
+
+    Once an IP exceeds the limit, the end of its window is remembered in a
+    small in-process LRU (ip -> blocked until epoch), so further requests
+    from that IP are rejected locally without a Redis roundtrip.
+    """
+
+    def __init__(self, app: ASGIApp, limit: Optional[int] = None) -> None:
+        self.app = app
+        self.limit = limit or settings.RATE_LIMIT_PER_MINUTE
+        self._blocked: "OrderedDict[str, int]" = OrderedDict()
+        self._last_redis_warning = 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in _UNLIMITED_METHODS
+            or scope["path"] in _EXEMPT_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        ip = client[0] if client else "unknown"
+        now = time.time()
+
+        # Known abuser still inside its window: reject without touching Redis
+        blocked_until = self._blocked.get(ip)
+        if blocked_until is not None:
+            if blocked_until > now:
+                await self._send_429(scope, receive, send, int(blocked_until - now) or 1)
+                return
+            del self._blocked[ip]
+
+        window = int(now) // RATE_LIMIT_WINDOW_SECONDS
+        count = await self._hit(scope["app"].state, f"rl:{ip}:{window}", now)
+        if count is not None and count > self.limit:
+            reset = (window + 1) * RATE_LIMIT_WINDOW_SECONDS
+            self._block(ip, reset)
+            await self._send_429(scope, receive, send, reset - int(now))
+            return
+
+        await self.app(scope, receive, send)
+
+    def _block(self, ip: str, until: int) -> None:
+        """Remember ip as blocked until the given epoch, evicting the oldest entry."""
+        self._blocked[ip] = until
+        self._blocked.move_to_end(ip)
+        if len(self._blocked) > BLOCK_CACHE_SIZE:
+            self._blocked.popitem(last=False)
+
+    async def _hit(self, state, key: str, now: float) -> Optional[int]:
+        """Increment the window counter for key; None if Redis is unavailable."""
+        redis_client = getattr(state, "redis", None)
+        if redis_client is None:
+            return None
+        try:
+            sha = getattr(state, "rl_sha", None)
+            if sha is None:
+                sha = state.rl_sha = await redis_client.script_load(RATE_LIMIT_SCRIPT)
+            try:
+                return await redis_client.evalsha(sha, 1, key, RATE_LIMIT_WINDOW_SECONDS)
+            except NoScriptError:
+                # Redis was restarted or flushed; register the script again
+                state.rl_sha = await redis_client.script_load(RATE_LIMIT_SCRIPT)
+                return await redis_client.evalsha(state.rl_sha, 1, key, RATE_LIMIT_WINDOW_SECONDS)
+        except RedisError as e:
+            if now - self._last_redis_warning >= REDIS_WARNING_INTERVAL_SECONDS:
+                self._last_redis_warning = now
+                logger.warning(f"Rate limit checks skipped, Redis unavailable: {e}")
+            return None
+
+    @staticmethod
+    async def _send_429(scope: Scope, receive: Receive, send: Send, retry_after: int) -> None:
+        """Send the 429 response in the same shape as rate_limit_exceeded_handler."""
+        response = JSONResponse(
+            status_code=429,
+            content={
+                "detail": "Rate limit exceeded. Please try again later.",
+                "error_code": "RATE_LIMIT_EXCEEDED",
+                "retry_after": f"{retry_after} seconds"
+            },
+            headers={"Retry-After": str(retry_after)}
+        )
+        await response(scope, receive, send)
@@ -2,7 +2,8 @@
 Subscription plans configuration.
 Defines the four tiers: Free, Starter, Standard, and Pro with monthly and yearly billing.
 """
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from enum import Enum
 
 
@@ -14,6 +15,18 @@ class PlanType(str, Enum):
     PRO = "pro"
 
 
+class SubscriptionStatus(str, Enum):
+    """Subscription statuses (mirrors Stripe's subscription statuses)."""
+    ACTIVE = "active"
+    TRIALING = "trialing"
+    PAST_DUE = "past_due"
+    CANCELED = "canceled"
+    INCOMPLETE = "incomplete"
+    INCOMPLETE_EXPIRED = "incomplete_expired"
+    UNPAID = "unpaid"
+    PAUSED = "paused"
+
+
 class BillingInterval(str, Enum):
     """Billing intervals."""
     MONTHLY = "monthly"
@@ -93,17 +106,24 @@ PLAN_FEATURES: Dict[str, Dict[str, Any]] = {
 }
 
 
-def get_plan_limits(plan_type: str) -> Dict[str, int]:
-    """Get limits for a specific plan."""
-    if plan_type not in PLAN_FEATURES:
-        plan_type = PlanType.FREE
-    
-    plan = PLAN_FEATURES[plan_type]
-    return {
+# Read-only limits per plan, derived once from PLAN_FEATURES
+_PLAN_LIMITS: Dict[str, Mapping[str, int]] = {
+    plan_type: MappingProxyType({
         "generations_limit": plan["generations_limit"],
         "max_websites": plan["max_websites"],
         "max_pages_per_website": plan["max_pages_per_website"]
-    }
+    })
+    for plan_type, plan in PLAN_FEATURES.items()
+}
+
+
+def get_plan_limits(plan_type: str) -> Mapping[str, int]:
+    """
+    Get limits for a specific plan.
+    
+    Returns a shared read-only mapping; use dict(...) if a mutable copy is needed.
+    """
+    return _PLAN_LIMITS.get(plan_type, _PLAN_LIMITS[PlanType.FREE])
 
 
 def get_plan_info(plan_type: str) -> Dict[str, Any]:
@@ -2,25 +2,106 @@
 FastAPI main application.
 Entry point for the LLMReady backend API.
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from slowapi.errors import RateLimitExceeded
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from starlette.concurrency import run_in_threadpool
+from typing import Optional, Tuple
 import logging
-import sentry_sdk
+import time
+
+import redis.asyncio as aioredis
 
 from app.core.config import settings
-from app.core.database import engine, Base
-from app.core.rate_limit import limiter, rate_limit_exceeded_handler
+from app.core.database import engine
+from app.core.rate_limit import (
+    limiter,
+    rate_limit_exceeded_handler,
+    RateLimitMiddleware,
+    RATE_LIMIT_SCRIPT,
+    RATE_LIMIT_REDIS_TIMEOUT_SECONDS,
+)
 from app.core.logging_config import configure_monitoring
-from app.core.security_middleware import SecurityHeadersMiddleware
-from app.api.v1 import auth, password_reset, email_verification, subscriptions, webhooks, generations, websites, contact, refunds
+from app.core.edge_middleware import EdgeMiddleware
+from app.core.error_middleware import ErrorBoundaryMiddleware
+from app.api.v1 import auth, password_reset, email_verification, subscriptions, webhooks
+from app.api.lazy_router import LazyRouter, load_lazy_routers
 
 # Initialize monitoring and logging BEFORE creating the app
 configure_monitoring()
 
 logger = logging.getLogger(__name__)
 
+
+def _warm_db_pool(db_engine: Engine) -> None:
+    """Check out pool_size connections at once so the pool is filled (blocking)."""
+    connections = []
+    try:
+        for _ in range(db_engine.pool.size()):
+            conn = db_engine.connect()
+            connections.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in connections:
+            conn.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: runs once per worker around the serving loop.
+    Long-lived resources are bound to app.state here so request handlers
+    reuse them instead of reaching for module-level globals.
+    """
+    logger.info(f"Starting {settings.PROJECT_NAME}")
+    logger.info(f"Debug mode: {settings.DEBUG}")
+    logger.info(f"Database: {settings.database_host}")
+    
+    # Note: In production, we use Alembic migrations instead of create_all.
+    # Schema creation never runs here, so startup can't block on DDL.
+    
+    app.state.engine = engine
+    
+    # Open the pool's connections up front so the first requests after a
+    # deploy don't each pay the connect + handshake cost
+    try:
+        await run_in_threadpool(_warm_db_pool, app.state.engine)
+    except Exception as e:
+        logger.warning(f"Database pool warm-up failed: {e}")
+    
+    # Shared async Redis client for the global rate limiter. The counter
+    # script is registered once so each request is a single EVALSHA, and
+    # short socket timeouts let the limiter fail open on a hung Redis.
+    app.state.redis = aioredis.from_url(
+        settings.REDIS_URL,
+        socket_timeout=RATE_LIMIT_REDIS_TIMEOUT_SECONDS,
+        socket_connect_timeout=RATE_LIMIT_REDIS_TIMEOUT_SECONDS
+    )
+    app.state.rl_sha = None
+    try:
+        app.state.rl_sha = await app.state.redis.script_load(RATE_LIMIT_SCRIPT)
+    except Exception as e:
+        logger.warning(f"Redis rate limit script registration failed: {e}")
+    
+    # SendGrid connection pool, bound to this worker's event loop. The
+    # email service (templates, httpx) is imported here rather than at
+    # module load so importing app.main stays cheap.
+    from app.services.email import email_service
+    app.state.email_service = email_service
+    await app.state.email_service.startup()
+    
+    yield
+    
+    logger.info(f"Shutting down {settings.PROJECT_NAME}")
+    # Close pooled database, Redis and SendGrid connections held by this worker
+    app.state.engine.dispose()
+    await app.state.redis.aclose()
+    await app.state.email_service.shutdown()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -28,21 +109,39 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    # orjson serializes the UUID/datetime-heavy response models natively
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Configure CORS
+# Error boundary for unhandled exceptions (innermost, so 500 responses
+# still get the CORS and security headers added by EdgeMiddleware)
+app.add_middleware(ErrorBoundaryMiddleware)
+
+# Global per-IP limit on write requests, backed by Redis (inside EdgeMiddleware so that
+# 429 responses still carry CORS headers the browser can read)
+app.add_middleware(RateLimitMiddleware)
+
+# Edge middleware: security headers, CORS and X-Response-Time in one layer.
+# Explicit method/header lists and a 24h max_age let browsers cache
+# preflights so the SPA doesn't send an OPTIONS before each call.
 app.add_middleware(
-    CORSMiddleware,
+    EdgeMiddleware,
     allow_origins=settings.get_cors_origins(),
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=[
+        "Authorization",
+        "Content-Type",
+        "X-Requested-With",
+        "X-Retry",  # Set by the frontend when replaying a request after token refresh
+        "Stripe-Signature",
+        "sentry-trace",  # Frontend Sentry tracing propagation
+        "baggage",
+    ],
+    max_age=86400,
 )
 
-# Add Security Headers Middleware
-app.add_middleware(SecurityHeadersMiddleware)
-
 # Add rate limiter state to app
 app.state.limiter = limiter
 
@@ -50,55 +149,6 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
 
-# Global exception handler for Sentry
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    """
-    Global exception handler that captures all unhandled exceptions
-    and sends them to Sentry before returning an error response.
-    """
-    # Capture exception in Sentry
-    if settings.SENTRY_DSN:
-        sentry_sdk.capture_exception(exc)
-    
-    # Log the error
-    logger.error(
-        f"Unhandled exception: {exc}",
-        exc_info=True,
-        extra={
-            "path": request.url.path,
-            "method": request.method,
-            "client_host": request.client.host if request.client else None,
-        }
-    )
-    
-    # Return appropriate error response
-    return JSONResponse(
-        status_code=500,
-        content={
-            "detail": "Internal server error",
-            "error": str(exc) if settings.DEBUG else "An unexpected error occurred"
-        }
-    )
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup."""
-    logger.info(f"Starting {settings.PROJECT_NAME}")
-    logger.info(f"Debug mode: {settings.DEBUG}")
-    logger.info(f"Database: {settings.DATABASE_URL.split('@')[1] if '@' in settings.DATABASE_URL else 'configured'}")
-    
-    # Note: In production, we use Alembic migrations instead of create_all
-    # Base.metadata.create_all(bind=engine)
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown."""
-    logger.info(f"Shutting down {settings.PROJECT_NAME}")
-
-
 @app.get("/", tags=["Root"])
 @limiter.limit(f"{settings.RATE_LIMIT_HEALTH_PER_MINUTE}/minute")
 async def root(request: Request):
@@ -111,6 +161,18 @@ async def root(request: Request):
     }
 
 
+# Health check results are memoized for a few seconds so frequent
+# liveness/readiness probes don't each take a pooled DB connection.
+_HEALTH_TTL = 5.0
+_health_cache: Optional[Tuple[float, dict]] = None
+
+
+def _ping_database(db_engine: Engine) -> None:
+    """Run a trivial query to verify database connectivity (blocking)."""
+    with db_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
 @app.get("/health", tags=["Health"])
 @limiter.limit(f"{settings.RATE_LIMIT_HEALTH_PER_MINUTE}/minute")
 async def health_check(request: Request):
@@ -118,24 +180,39 @@ async def health_check(request: Request):
     Health check endpoint.
     Returns 200 if the service is healthy.
     Rate limited to prevent abuse.
+    
+    Healthy results are cached for _HEALTH_TTL seconds, and the database
+    ping runs in the threadpool so it never blocks the event loop.
     """
+    global _health_cache
+    
+    now = time.monotonic()
+    if _health_cache is not None and now - _health_cache[0] < _HEALTH_TTL:
+        return ORJSONResponse(status_code=200, content=_health_cache[1])
+    
     try:
         # Test database connection
-        from sqlalchemy import text
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        await run_in_threadpool(_ping_database, request.app.state.engine)
+        
+        payload = {
+            "status": "healthy",
+            "database": "connected",
+            # SendGrid circuit breaker state (closed, open or half_open);
+            # an open circuit degrades email but not the API itself
+            "email": request.app.state.email_service.breaker.state,
+            "service": settings.PROJECT_NAME
+        }
+        _health_cache = (now, payload)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
-            content={
-                "status": "healthy",
-                "database": "connected",
-                "service": settings.PROJECT_NAME
-            }
+            content=payload
         )
     except Exception as e:
+        # Never serve a stale "healthy" result once a probe has failed
+        _health_cache = None
         logger.error(f"Health check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
@@ -144,15 +221,21 @@ async def health_check(request: Request):
             }
         )
 
-@app.get("/test-sentry", tags=["Testing"])
-async def test_sentry():
-    """
-    Test endpoint to verify Sentry error tracking.
-    This endpoint intentionally throws an error to test monitoring.
-    """
-    logger.info("Test Sentry endpoint called - about to throw an error")
-    raise ValueError("🔥 This is a TEST error to verify Sentry is working! If you see this in Sentry, everything is configured correctly.")
+# Message raised by /test-sentry (built once, not per call)
+_TEST_SENTRY_MESSAGE = "🔥 This is a TEST error to verify Sentry is working! If you see this in Sentry, everything is configured correctly."
 
+# Only exposed in DEBUG mode so production traffic can't burn Sentry quota
+if settings.DEBUG:
+    @app.get("/test-sentry", tags=["Testing"])
+    @limiter.limit("1/minute")
+    async def test_sentry(request: Request):
+        """
+        Test endpoint to verify Sentry error tracking.
+        This endpoint intentionally throws an error to test monitoring.
+        Only registered when DEBUG is enabled; rate limited to 1/minute.
+        """
+        logger.info("Test Sentry endpoint called - about to throw an error")
+        raise ValueError(_TEST_SENTRY_MESSAGE)
 
 
 # API v1 routes - Authentication
@@ -186,30 +269,49 @@ app.include_router(
     prefix=settings.API_V1_PREFIX
 )
 
+# Rarely-hit routers are imported on first request to their prefix instead
+# of at boot; their modules pull in Celery tasks, Stripe and email templates.
 # API v1 routes - Generations
-app.include_router(
-    generations.router,
+app.router.routes.append(LazyRouter(
+    app,
+    "app.api.v1.generations",
+    path_prefix=f"{settings.API_V1_PREFIX}/generations",
     prefix=settings.API_V1_PREFIX
-)
+))
 
 # API v1 routes - Websites
-app.include_router(
-    websites.router,
+app.router.routes.append(LazyRouter(
+    app,
+    "app.api.v1.websites",
+    path_prefix=f"{settings.API_V1_PREFIX}/websites",
     prefix=settings.API_V1_PREFIX
-)
+))
 
 # API v1 routes - Contact (public)
-app.include_router(
-    contact.router,
+app.router.routes.append(LazyRouter(
+    app,
+    "app.api.v1.contact",
+    path_prefix=f"{settings.API_V1_PREFIX}/contact",
     prefix=settings.API_V1_PREFIX
-)
+))
 
 # API v1 routes - Refunds (EU cooling-off period)
-app.include_router(
-    refunds.router,
+app.router.routes.append(LazyRouter(
+    app,
+    "app.api.v1.refunds",
+    path_prefix=f"{settings.API_V1_PREFIX}/refunds",
     prefix=settings.API_V1_PREFIX
-)
+))
+
+
+def openapi_with_lazy_routers():
+    """Build the OpenAPI schema with lazily-registered routers included."""
+    if app.openapi_schema is None:
+        load_lazy_routers(app)
+    return FastAPI.openapi(app)
+
 
+app.openapi = openapi_with_lazy_routers
 
 if __name__ == "__main__":
     import uvicorn
@@ -2,7 +2,7 @@
 Email Verification Token model for email verification flow.
 Tokens expire after 48 hours and are single-use only.
 """
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -29,7 +29,7 @@ class EmailVerificationToken(Base):
     is_used = Column(Boolean, default=False, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.timezone('utc', func.now()), nullable=False)
     expires_at = Column(DateTime, default=lambda: datetime.utcnow() + timedelta(hours=48), nullable=False)
     used_at = Column(DateTime, nullable=True)
     
@@ -2,15 +2,22 @@
 Generation model for tracking file generation tasks.
 Manages status, progress, and file metadata for each generation.
 """
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Numeric
+from sqlalchemy import Column, String, Integer, SmallInteger, BigInteger, DateTime, ForeignKey, Text, Numeric, Index, CheckConstraint, Enum as SqlEnum, text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 import uuid
-from datetime import datetime
 
 from app.core.database import Base
 
 
+# Allowed generation statuses, stored as a native PostgreSQL ENUM
+GENERATION_STATUSES = ("pending", "processing", "completed", "failed")
+GenerationStatusEnum = SqlEnum(*GENERATION_STATUSES, name="generation_status")
+IN_PROGRESS_STATUSES = ("pending", "processing")
+_IN_PROGRESS_SET = frozenset(IN_PROGRESS_STATUSES)
+
+
 class Generation(Base):
     """File generation task model."""
     
@@ -20,38 +27,64 @@ class Generation(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     
     # Foreign Keys
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     website_id = Column(UUID(as_uuid=True), ForeignKey("websites.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Status Tracking (pending, processing, completed, failed)
-    status = Column(String(50), default='pending', nullable=False, index=True)
+    status = Column(GenerationStatusEnum, default='pending', nullable=False)
     
     # Progress Tracking
-    progress_percentage = Column(Integer, default=0, nullable=False)
+    progress_percentage = Column(SmallInteger, default=0, nullable=False)  # 0-100
     pages_crawled = Column(Integer, default=0, nullable=False)
     total_pages = Column(Integer, nullable=True)
     
     # Error Handling
     error_message = Column(Text, nullable=True)
-    retry_count = Column(Integer, default=0, nullable=False)
+    retry_count = Column(SmallInteger, default=0, nullable=False)
     
     # File Metadata
     file_path = Column(String(500), nullable=True)  # Path to generated ZIP file
-    file_size = Column(Integer, nullable=True)  # Size in bytes
+    file_size = Column(BigInteger, nullable=True)  # Size in bytes (archives can exceed 2 GB)
     total_files = Column(Integer, default=0, nullable=False)  # Number of files in generation
     
     # Celery Task ID (for Week 6)
-    celery_task_id = Column(String(255), nullable=True, unique=True, index=True)
+    celery_task_id = Column(String(255), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Generated by the database (UTC) and returned on INSERT/UPDATE via eager_defaults
+    created_at = Column(DateTime, server_default=func.timezone('utc', func.now()), nullable=False)
+    updated_at = Column(
+        DateTime,
+        server_default=func.timezone('utc', func.now()),
+        onupdate=func.timezone('utc', func.now()),
+        nullable=False
+    )
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
     
     # Duration in seconds
     duration_seconds = Column(Numeric(10, 2), nullable=True)
     
+    # Indexes and constraints
+    # user_id/status/created_at are covered by the composite index, which
+    # matches the "my generations, filtered by status, newest first" queries.
+    # The partial index only holds in-progress rows, so active-job lookups
+    # stay tiny regardless of how much history accumulates.
+    __table_args__ = (
+        Index("ix_generations_user_status_created", user_id, status, created_at.desc()),
+        Index(
+            "ix_generations_active",
+            user_id,
+            status,
+            postgresql_where=text("status IN ('pending', 'processing')")
+        ),
+        Index("ix_generations_celery_task_id", celery_task_id, unique=True),
+        CheckConstraint(
+            "progress_percentage BETWEEN 0 AND 100",
+            name="ck_generations_progress_percentage"
+        ),
+    )
+    
     # Relationships
     user = relationship("User", back_populates="generations")
     website = relationship("Website", back_populates="generations")
@@ -59,14 +92,30 @@ class Generation(Base):
     def __repr__(self):
         return f"<Generation(id={self.id}, status={self.status}, website_id={self.website_id})>"
     
+    @hybrid_property
     def is_completed(self) -> bool:
         """Check if generation is completed."""
         return self.status == 'completed'
     
+    @is_completed.expression
+    def is_completed(cls):
+        return cls.status == 'completed'
+    
+    @hybrid_property
     def is_failed(self) -> bool:
         """Check if generation has failed."""
         return self.status == 'failed'
     
+    @is_failed.expression
+    def is_failed(cls):
+        return cls.status == 'failed'
+    
+    @hybrid_property
     def is_in_progress(self) -> bool:
-        """Check if generation is in progress."""
-        return self.status in ['pending', 'processing']
\ No newline at end of file
+        """Check if generation is in progress (pending or processing)."""
+        return self.status in _IN_PROGRESS_SET
+    
+    @is_in_progress.expression
+    def is_in_progress(cls):
+        # Matches the ix_generations_active partial index predicate
+        return cls.status.in_(IN_PROGRESS_STATUSES)
@@ -2,13 +2,19 @@
 Subscription model for managing user plans and billing.
 Integrates with Stripe for payment processing.
 """
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean, Numeric
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Boolean, Numeric, Enum as SqlEnum, case, cast, func
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, relationship
 import uuid
-from datetime import datetime
 
 from app.core.database import Base
+from app.core.subscription_plans import PlanType, SubscriptionStatus
+
+
+# Native PostgreSQL ENUM types. Values (not member names) are stored so the
+# columns keep reading and writing the same plain strings as before.
+PlanTypeEnum = SqlEnum(*[plan.value for plan in PlanType], name="plan_type")
+SubscriptionStatusEnum = SqlEnum(*[status.value for status in SubscriptionStatus], name="subscription_status")
 
 
 class Subscription(Base):
@@ -22,21 +28,35 @@ class Subscription(Base):
     # Foreign Key to User
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
     
-    # Subscription Plan (free, standard, pro)
-    plan_type = Column(String(50), default='free', nullable=False)
+    # Subscription Plan (free, starter, standard, pro)
+    plan_type = Column(PlanTypeEnum, default='free', nullable=False)
     
     # Stripe Integration
     stripe_customer_id = Column(String(255), nullable=True, unique=True, index=True)
     stripe_subscription_id = Column(String(255), nullable=True, unique=True, index=True)
     stripe_price_id = Column(String(255), nullable=True)
     
-    # Subscription Status (active, canceled, past_due, incomplete)
-    status = Column(String(50), default='active', nullable=False)
+    # Subscription Status (active, trialing, past_due, canceled, incomplete, ...)
+    status = Column(SubscriptionStatusEnum, default='active', nullable=False)
     
     # Usage Tracking
     generations_used = Column(Integer, default=0, nullable=False)
     generations_limit = Column(Integer, default=1, nullable=False)  # free: 1, standard: 10, pro: 25
     
+    # Derived usage, computed by the database as part of the row SELECT
+    remaining_generations = column_property(
+        func.greatest(generations_limit - generations_used, 0)
+    )
+    usage_percentage = column_property(
+        case(
+            (
+                generations_limit > 0,
+                cast(func.round(cast(generations_used, Numeric) * 100 / generations_limit, 2), Float)
+            ),
+            else_=0.0
+        )
+    )
+    
     # Websites Tracking
     websites_count = Column(Integer, default=0, nullable=False)
     websites_limit = Column(Integer, default=1, nullable=False)  # free: 1, standard: 5, pro: 999
@@ -51,8 +71,14 @@ class Subscription(Base):
     currency = Column(String(3), default='EUR', nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Generated by the database (UTC) and returned on INSERT/UPDATE via eager_defaults
+    created_at = Column(DateTime, server_default=func.timezone('utc', func.now()), nullable=False)
+    updated_at = Column(
+        DateTime,
+        server_default=func.timezone('utc', func.now()),
+        onupdate=func.timezone('utc', func.now()),
+        nullable=False
+    )
     canceled_at = Column(DateTime, nullable=True)
     
     # Relationships
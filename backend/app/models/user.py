@@ -2,11 +2,10 @@
 User model for authentication and authorization.
 Handles user accounts, roles, and verification status.
 """
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
-from datetime import datetime
 
 from app.core.database import Base
 
@@ -34,16 +33,22 @@ class User(Base):
     role = Column(String(50), default='user', nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    last_login_at = Column(DateTime, nullable=True)
+    # Timezone-aware (timestamptz), generated by the database and returned
+    # on INSERT/UPDATE via eager_defaults
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    last_login_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
-    subscription = relationship("Subscription", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    websites = relationship("Website", back_populates="user", cascade="all, delete-orphan")
-    generations = relationship("Generation", back_populates="user", cascade="all, delete-orphan")
-    password_reset_tokens = relationship("PasswordResetToken", back_populates="user", cascade="all, delete-orphan")
-    email_verification_tokens = relationship("EmailVerificationToken", back_populates="user", cascade="all, delete-orphan")
+    # Collections are always queried explicitly (filtered and paginated), so
+    # implicit lazy loads raise instead of silently issuing one query per
+    # user. Deleting a user is left to the ON DELETE CASCADE foreign keys
+    # (passive_deletes) instead of loading every child to delete it one by one.
+    subscription = relationship("Subscription", back_populates="user", uselist=False, cascade="all, delete", passive_deletes=True)
+    websites = relationship("Website", back_populates="user", cascade="all, delete", lazy="raise_on_sql", passive_deletes=True)
+    generations = relationship("Generation", back_populates="user", cascade="all, delete", lazy="raise_on_sql", passive_deletes=True)
+    password_reset_tokens = relationship("PasswordResetToken", back_populates="user", cascade="all, delete", lazy="raise_on_sql", passive_deletes=True)
+    email_verification_tokens = relationship("EmailVerificationToken", back_populates="user", cascade="all, delete", lazy="raise_on_sql", passive_deletes=True)
     
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
\ No newline at end of file
@@ -2,11 +2,10 @@
 Website model for managing user's configured websites.
 Stores URL, crawling patterns, and generation limits.
 """
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, Index, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import relationship
 import uuid
-from datetime import datetime
 
 from app.core.database import Base
 
@@ -20,7 +19,7 @@ class Website(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     
     # Foreign Key to User
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # Website Configuration
     url = Column(String(500), nullable=False)
@@ -28,34 +27,43 @@ class Website(Base):
     description = Column(Text, nullable=True)
     
     # Crawling Configuration
-    include_patterns = Column(Text, nullable=True)  # Comma-separated patterns
-    exclude_patterns = Column(Text, nullable=True)  # Comma-separated patterns
+    include_patterns = Column(ARRAY(String), nullable=True)  # Normalized (lowercase) patterns
+    exclude_patterns = Column(ARRAY(String), nullable=True)
     max_pages = Column(Integer, default=100, nullable=False)
-    use_playwright = Column(Integer, default=0, nullable=False)  # 0=False, 1=True (for SQLite compatibility)
+    use_playwright = Column(Boolean, default=False, nullable=False)
     timeout = Column(Integer, default=300, nullable=False)  # seconds
     
     # Metadata
-    is_active = Column(Integer, default=1, nullable=False)  # 0=False, 1=True
-    last_generated_at = Column(DateTime, nullable=True)
+    is_active = Column(Boolean, default=True, nullable=False)
+    last_generated_at = Column(DateTime(timezone=True), nullable=True)
     generation_count = Column(Integer, default=0, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Timezone-aware (timestamptz), generated by the database and returned
+    # on INSERT/UPDATE via eager_defaults
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    # Serves the website list (user_id, optional is_active filter, newest first);
+    # its user_id prefix replaces the former single-column index
+    __table_args__ = (
+        Index("ix_websites_user_active_created", user_id, is_active, created_at.desc()),
+        # Smaller index for the common active-only listing and active counts
+        Index(
+            "ix_websites_active_user_created",
+            user_id,
+            created_at.desc(),
+            postgresql_where=text("is_active = true")
+        ),
+        # Allows pattern lookups such as include_patterns @> ARRAY['docs']
+        Index("ix_websites_include_patterns_gin", include_patterns, postgresql_using="gin"),
+    )
     
     # Relationships
     user = relationship("User", back_populates="websites")
-    generations = relationship("Generation", back_populates="website", cascade="all, delete-orphan")
+    # Generations are queried explicitly; deleting a website relies on the
+    # ON DELETE CASCADE foreign key rather than loading its whole history
+    generations = relationship("Generation", back_populates="website", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
     
     def __repr__(self):
         return f"<Website(id={self.id}, url={self.url}, user_id={self.user_id})>"
-    
-    @property
-    def is_active_bool(self) -> bool:
-        """Return is_active as boolean."""
-        return bool(self.is_active)
-    
-    @property
-    def use_playwright_bool(self) -> bool:
-        """Return use_playwright as boolean."""
-        return bool(self.use_playwright)
\ No newline at end of file
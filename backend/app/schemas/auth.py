@@ -5,8 +5,44 @@ Defines data models for registration, login, tokens, and user responses.
 from typing import Optional
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, Field, validator
-import re
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter, field_validator
+
+
+# Character-class flags for password strength checks
+_HAS_UPPER = 1
+_HAS_LOWER = 2
+_HAS_DIGIT = 4
+_HAS_ALL = _HAS_UPPER | _HAS_LOWER | _HAS_DIGIT
+
+
+def _validate_password_strength(v: str) -> str:
+    """
+    Validate password meets security requirements.
+    Scans the password once, stopping as soon as every character class is seen.
+    """
+    if len(v) < 8:
+        raise ValueError('Password must be at least 8 characters long')
+    
+    flags = 0
+    for c in v:
+        if 'A' <= c <= 'Z':
+            flags |= _HAS_UPPER
+        elif 'a' <= c <= 'z':
+            flags |= _HAS_LOWER
+        elif '0' <= c <= '9':
+            flags |= _HAS_DIGIT
+        else:
+            continue
+        if flags == _HAS_ALL:
+            return v
+    
+    if not flags & _HAS_UPPER:
+        raise ValueError('Password must contain at least one uppercase letter')
+    if not flags & _HAS_LOWER:
+        raise ValueError('Password must contain at least one lowercase letter')
+    if not flags & _HAS_DIGIT:
+        raise ValueError('Password must contain at least one digit')
+    return v
 
 
 class UserRegister(BaseModel):
@@ -15,18 +51,11 @@ class UserRegister(BaseModel):
     password: str = Field(..., min_length=8, max_length=100, description="User password (min 8 characters)")
     full_name: Optional[str] = Field(None, max_length=255, description="User full name")
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password_strength(cls, v):
         """Validate password meets security requirements."""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one digit')
-        return v
+        return _validate_password_strength(v)
 
 
 class UserLogin(BaseModel):
@@ -41,6 +70,8 @@ class TokenResponse(BaseModel):
     refresh_token: str = Field(..., description="JWT refresh token")
     token_type: str = Field(default="bearer", description="Token type")
     expires_in: int = Field(..., description="Access token expiration time in seconds")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class RefreshTokenRequest(BaseModel):
@@ -59,8 +90,7 @@ class UserResponse(BaseModel):
     created_at: datetime = Field(..., description="Account creation timestamp")
     last_login_at: Optional[datetime] = Field(None, description="Last login timestamp")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LoginResponse(BaseModel):
@@ -70,6 +100,8 @@ class LoginResponse(BaseModel):
     refresh_token: str = Field(..., description="JWT refresh token")
     token_type: str = Field(default="bearer", description="Token type")
     expires_in: int = Field(..., description="Access token expiration time in seconds")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class PasswordResetRequest(BaseModel):
@@ -82,18 +114,11 @@ class PasswordResetConfirm(BaseModel):
     token: str = Field(..., description="Password reset token from email")
     new_password: str = Field(..., min_length=8, max_length=100, description="New password")
     
-    @validator('new_password')
+    @field_validator('new_password')
+    @classmethod
     def validate_password_strength(cls, v):
         """Validate password meets security requirements."""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one digit')
-        return v
+        return _validate_password_strength(v)
 
 
 class EmailVerificationRequest(BaseModel):
@@ -105,9 +130,20 @@ class MessageResponse(BaseModel):
     """Generic message response schema."""
     message: str = Field(..., description="Response message")
     detail: Optional[str] = Field(None, description="Additional details")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class ErrorResponse(BaseModel):
     """Error response schema."""
     detail: str = Field(..., description="Error message")
-    error_code: Optional[str] = Field(None, description="Error code for client handling")
\ No newline at end of file
+    error_code: Optional[str] = Field(None, description="Error code for client handling")
+    
+    model_config = ConfigDict(frozen=True)
+
+
+# Build the email validator once at import and run it, so the first
+# register/login request doesn't pay for email-validator's lazy setup.
+# Reuse this adapter for any manual email checks.
+_EMAIL_ADAPTER = TypeAdapter(EmailStr)
+_EMAIL_ADAPTER.validate_python('warmup@example.com')
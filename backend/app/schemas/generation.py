@@ -4,7 +4,7 @@ Pydantic schemas for generation endpoints.
 from datetime import datetime
 from typing import Optional, List, Literal
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class FileRecommendation(BaseModel):
@@ -44,8 +44,7 @@ class GenerationResponse(BaseModel):
     duration_seconds: Optional[float] = None
     recommendation: Optional[FileRecommendation] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class GenerationListResponse(BaseModel):
@@ -55,6 +54,8 @@ class GenerationListResponse(BaseModel):
     page: int
     per_page: int
     pages: int
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class GenerationStartResponse(BaseModel):
@@ -62,6 +63,8 @@ class GenerationStartResponse(BaseModel):
     generation_id: UUID
     status: str
     message: str
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class GenerationStatusResponse(BaseModel):
@@ -78,6 +81,8 @@ class GenerationStatusResponse(BaseModel):
     duration_seconds: Optional[float] = None
     can_download: bool
     recommendation: Optional[FileRecommendation] = None
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class QuotaCheckResponse(BaseModel):
@@ -86,4 +91,6 @@ class QuotaCheckResponse(BaseModel):
     generations_used: int
     generations_limit: int
     remaining_generations: int
-    message: str
\ No newline at end of file
+    message: str
+    
+    model_config = ConfigDict(frozen=True)
\ No newline at end of file
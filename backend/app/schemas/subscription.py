@@ -1,10 +1,10 @@
 """
 Subscription-related schemas for request/response models.
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from app.core.subscription_plans import PlanType
 
 
@@ -47,24 +47,29 @@ class CheckoutSessionCreate(BaseModel):
             return None
         return v
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "plan_type": "standard",
                 "billing_interval": "monthly"
             }
         }
+    )
 
 
 class CheckoutSessionResponse(BaseModel):
     """Response after creating checkout session."""
     checkout_url: str = Field(..., description="Stripe checkout session URL")
     session_id: str = Field(..., description="Stripe session ID")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class CustomerPortalResponse(BaseModel):
     """Response for customer portal link."""
     portal_url: str = Field(..., description="Stripe customer portal URL")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class PlanInfo(BaseModel):
@@ -77,13 +82,16 @@ class PlanInfo(BaseModel):
     max_websites: int
     max_pages_per_website: int
     features: List[str]
+    
+    # Instances are cached and shared between responses
+    model_config = ConfigDict(frozen=True)
 
 
 class SubscriptionInfo(BaseModel):
     """Current subscription information."""
     id: UUID
     user_id: UUID
-    plan_type: str
+    plan_type: Literal["free", "starter", "standard", "pro"]
     stripe_customer_id: Optional[str]
     stripe_subscription_id: Optional[str]
     status: str
@@ -101,8 +109,7 @@ class SubscriptionInfo(BaseModel):
     usage_percentage: float
     plan_info: PlanInfo
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class UsageStats(BaseModel):
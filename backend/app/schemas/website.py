@@ -1,10 +1,35 @@
 """
 Website schemas for request/response validation.
 """
-from pydantic import BaseModel, Field, HttpUrl, validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
+import re
+
+
+# Separator for comma-separated patterns, absorbing surrounding whitespace
+_COMMA_SPLIT = re.compile(r'\s*,\s*')
+
+# URL scheme check for website URLs
+_SCHEME_RE = re.compile(r'^https?://', re.IGNORECASE)
+
+
+def _clean_patterns(v):
+    """
+    Normalize patterns to a list of lowercase, trimmed, non-empty items.
+    Accepts a list or, for older clients, a comma-separated string.
+    """
+    if v is None:
+        return None
+    if isinstance(v, str):
+        items = _COMMA_SPLIT.split(v.strip().lower())
+    elif isinstance(v, (list, tuple)) and all(isinstance(p, str) for p in v):
+        items = [p.strip().lower() for p in v]
+    else:
+        # Let the field's type validation report the error
+        return v
+    return [p for p in items if p] or None
 
 
 class WebsiteBase(BaseModel):
@@ -12,36 +37,32 @@ class WebsiteBase(BaseModel):
     url: str = Field(..., description="Website URL to crawl")
     name: Optional[str] = Field(None, max_length=255, description="User-friendly name for the website")
     description: Optional[str] = Field(None, description="Optional description of the website")
-    include_patterns: Optional[str] = Field(None, description="Comma-separated URL patterns to include (e.g., 'docs,blog,faq')")
-    exclude_patterns: Optional[str] = Field(None, description="Comma-separated URL patterns to exclude (e.g., 'login,cart,admin')")
+    include_patterns: Optional[List[str]] = Field(None, description="URL patterns to include (e.g., ['docs', 'blog', 'faq'])")
+    exclude_patterns: Optional[List[str]] = Field(None, description="URL patterns to exclude (e.g., ['login', 'cart', 'admin'])")
     max_pages: int = Field(100, ge=1, le=1000, description="Maximum number of pages to crawl")
     use_playwright: bool = Field(False, description="Use Playwright for JavaScript rendering")
     timeout: int = Field(300, ge=30, le=3600, description="Timeout in seconds")
     is_active: bool = Field(True, description="Whether the website is active")
 
-    @validator('url')
+    @field_validator('url')
+    @classmethod
     def validate_url(cls, v):
         """Ensure URL is valid and has a scheme."""
         if not v:
             raise ValueError("URL cannot be empty")
         
         # Add scheme if missing
-        if not v.startswith(('http://', 'https://')):
+        if not _SCHEME_RE.match(v):
             v = 'https://' + v
         
-        # Basic validation
-        if not v.startswith(('http://', 'https://')):
-            raise ValueError("URL must start with http:// or https://")
-        
         return v.rstrip('/')
 
-    @validator('include_patterns', 'exclude_patterns')
+    @field_validator('include_patterns', 'exclude_patterns', mode='before')
+    @classmethod
     def validate_patterns(cls, v):
         """Clean up patterns."""
-        if v:
-            # Remove spaces, ensure lowercase
-            return ','.join([p.strip().lower() for p in v.split(',') if p.strip()])
-        return v
+        # Remove spaces, ensure lowercase
+        return _clean_patterns(v)
 
 
 class WebsiteCreate(WebsiteBase):
@@ -54,28 +75,28 @@ class WebsiteUpdate(BaseModel):
     url: Optional[str] = Field(None, description="Website URL to crawl")
     name: Optional[str] = Field(None, max_length=255)
     description: Optional[str] = None
-    include_patterns: Optional[str] = None
-    exclude_patterns: Optional[str] = None
+    include_patterns: Optional[List[str]] = None
+    exclude_patterns: Optional[List[str]] = None
     max_pages: Optional[int] = Field(None, ge=1, le=1000)
     use_playwright: Optional[bool] = None
     timeout: Optional[int] = Field(None, ge=30, le=3600)
     is_active: Optional[bool] = None
 
-    @validator('url')
+    @field_validator('url')
+    @classmethod
     def validate_url(cls, v):
         """Ensure URL is valid if provided."""
         if v:
-            if not v.startswith(('http://', 'https://')):
+            if not _SCHEME_RE.match(v):
                 v = 'https://' + v
             return v.rstrip('/')
         return v
 
-    @validator('include_patterns', 'exclude_patterns')
+    @field_validator('include_patterns', 'exclude_patterns', mode='before')
+    @classmethod
     def validate_patterns(cls, v):
         """Clean up patterns if provided."""
-        if v:
-            return ','.join([p.strip().lower() for p in v.split(',') if p.strip()])
-        return v
+        return _clean_patterns(v)
 
 
 class WebsiteResponse(WebsiteBase):
@@ -87,8 +108,7 @@ class WebsiteResponse(WebsiteBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class WebsiteListResponse(BaseModel):
@@ -98,6 +118,8 @@ class WebsiteListResponse(BaseModel):
     page: int
     per_page: int
     pages: int
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class WebsiteStats(BaseModel):
@@ -110,6 +132,8 @@ class WebsiteStats(BaseModel):
     failed_generations: int
     last_generation_at: Optional[datetime]
     success_rate: float  # Percentage
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class UserStats(BaseModel):
@@ -121,4 +145,6 @@ class UserStats(BaseModel):
     failed_generations: int
     generations_this_month: int
     generations_remaining: int
-    success_rate: float  # Percentage
\ No newline at end of file
+    success_rate: float  # Percentage
+    
+    model_config = ConfigDict(frozen=True)
\ No newline at end of file
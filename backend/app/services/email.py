@@ -2,32 +2,455 @@
 Email service for sending verification and password reset emails.
 Uses SendGrid for email delivery.
 """
+import asyncio
 import logging
-from typing import Optional
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail, Email, To, Content
-import os
+import random
+import re
+import threading
+import time
+import weakref
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+import httpx
+import orjson
+from celery.signals import worker_process_init, worker_process_shutdown
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from markupsafe import Markup
 
 from app.core.config import settings
 
+# uvloop ships with uvicorn[standard] and already drives the API server;
+# use it for the sync wrappers' loops too when it is installed
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:  # e.g. Windows development setups
+    _new_event_loop = asyncio.new_event_loop
+
 
 logger = logging.getLogger(__name__)
 
+# Frontend links, resolved once from settings at import
+_FRONTEND_URL = settings.FRONTEND_URL
+_DASHBOARD_URL = _FRONTEND_URL + "/dashboard"
+_PRICING_URL = _FRONTEND_URL + "/pricing"
+_UPDATE_PAYMENT_URL = _DASHBOARD_URL + "?action=update_payment"
+_VERIFY_URL_PREFIX = _FRONTEND_URL + "/verify-email/"
+_RESET_URL_PREFIX = _FRONTEND_URL + "/reset-password/"
+_GENERATION_URL_PREFIX = _DASHBOARD_URL + "/generations/"
+
+# SendGrid v3 send endpoint, called directly with an async HTTP client
+SENDGRID_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+SENDGRID_TIMEOUT_SECONDS = 10.0
+
+# Keep-alive pool shared by all sends, so bursts of emails reuse TLS
+# connections to SendGrid instead of handshaking for every message
+SENDGRID_POOL_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=30.0
+)
+
+# Retries for transient SendGrid failures: full-jitter exponential backoff,
+# capped attempts, and a per-process budget (tokens refilled per second) so
+# an outage can't turn every send into a burst of retries
+SENDGRID_MAX_ATTEMPTS = 4
+SENDGRID_BACKOFF_BASE_SECONDS = 0.5
+SENDGRID_BACKOFF_CAP_SECONDS = 8.0
+SENDGRID_RETRY_BUDGET = 10
+SENDGRID_RETRY_REFILL_PER_SECOND = 1.0
+_RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Circuit breaker: after this many consecutive failed requests, stop calling
+# SendGrid for the cool-down period and fail sends immediately
+SENDGRID_BREAKER_FAIL_MAX = 5
+SENDGRID_BREAKER_RESET_SECONDS = 30.0
+
+# Inline styles shared by every email. The layout (_base.html) and the
+# button macro (_components.html) read these, so templates only hold the
+# parts of each email that actually differ.
+_BRAND_GRADIENT = "#667eea 0%, #764ba2 100%"
+_BODY_STYLE = "font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;"
+_HEADER_STYLE = "padding: 30px; text-align: center; border-radius: 10px 10px 0 0;"
+_CONTENT_STYLE = "background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;"
+_FOOTER_STYLE = "text-align: center; margin-top: 20px; color: #999; font-size: 12px;"
+_BUTTON_BASE_STYLE = "padding: 15px 40px; text-decoration: none; border-radius: 5px; font-weight: bold; display: inline-block;"
+_BUTTON_STYLE = f"background: linear-gradient(135deg, {_BRAND_GRADIENT}); color: white; {_BUTTON_BASE_STYLE}"
+_SECURE_BUTTON_STYLE = f"background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%); color: white; {_BUTTON_BASE_STYLE}"
+_SECONDARY_BUTTON_STYLE = "background: #f3f4f6; color: #667eea; padding: 12px 30px; text-decoration: none; border-radius: 5px; font-weight: bold; display: inline-block; border: 2px solid #667eea;"
+
+# Email bodies live in email_templates/ as <name>.html / <name>.txt pairs.
+# They are compiled once at import (auto_reload off, so rendering never
+# touches the filesystem again); HTML output is autoescaped.
+EMAIL_TEMPLATE_DIR = Path(__file__).parent / "email_templates"
+EMAIL_TEMPLATE_NAMES = (
+    "verification",
+    "password_reset",
+    "generation_complete",
+    "generation_failed",
+    "cooling_off_refund",
+    "contact_form",
+    "subscription_payment",
+    "payment_success",
+    "payment_failed",
+    "chargeback",
+    "refund",
+    "payment_action_required",
+    "subscription_canceled",
+)
+
+# Line breaks between adjacent tags, dropped when HTML templates are minified
+_BETWEEN_TAGS_RE = re.compile(r">\n<")
+
+
+class _MinifyingLoader(FileSystemLoader):
+    """
+    Template loader that strips indentation, blank lines and the line breaks
+    between adjacent tags from HTML templates as they are compiled, so every
+    send carries a smaller body. Plain-text templates are loaded unchanged.
+    """
+    
+    def get_source(self, environment, template):
+        source, filename, uptodate = super().get_source(environment, template)
+        if template.endswith(".html"):
+            source = "\n".join(line.strip() for line in source.splitlines() if line.strip())
+            source = _BETWEEN_TAGS_RE.sub("><", source)
+        return source, filename, uptodate
+
+
+_template_env = Environment(
+    loader=_MinifyingLoader(EMAIL_TEMPLATE_DIR),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    # Never evict compiled templates; the set is small and fixed
+    cache_size=-1
+)
+
+# Values every email may reference (also sent to SendGrid dynamic templates)
+_SHARED_TEMPLATE_DATA = {
+    "frontend_url": _FRONTEND_URL,
+    "dashboard_url": _DASHBOARD_URL,
+    "pricing_url": _PRICING_URL,
+    "update_payment_url": _UPDATE_PAYMENT_URL,
+    "support_email": settings.FROM_EMAIL,
+}
+_template_env.globals.update(
+    _SHARED_TEMPLATE_DATA,
+    brand_gradient=_BRAND_GRADIENT,
+    body_style=_BODY_STYLE,
+    header_style=_HEADER_STYLE,
+    content_style=_CONTENT_STYLE,
+    footer_style=_FOOTER_STYLE,
+    button_style=_BUTTON_STYLE,
+    secure_button_style=_SECURE_BUTTON_STYLE,
+    secondary_button_style=_SECONDARY_BUTTON_STYLE
+)
+
+# Compile the shared layout and macros up front as well, so the first
+# email of each kind doesn't pay to compile its parent templates
+for _shared in ("_base.html", "_components.html"):
+    _template_env.get_template(_shared)
+
+
+class _EmailTemplates(NamedTuple):
+    """Compiled HTML and plain-text bodies of one named email."""
+    html: Template
+    text: Template
+
+
+_TEMPLATES: Dict[str, _EmailTemplates] = {
+    name: _EmailTemplates(
+        html=_template_env.get_template(f"{name}.html"),
+        text=_template_env.get_template(f"{name}.txt")
+    )
+    for name in EMAIL_TEMPLATE_NAMES
+}
+
+# Refund breakdown fragment of the cooling-off refund email
+_REFUND_BREAKDOWN = _EmailTemplates(
+    html=_template_env.get_template("_refund_breakdown.html"),
+    text=_template_env.get_template("_refund_breakdown.txt")
+)
+
+
+# Emails hosted as SendGrid dynamic templates (only those with an ID set)
+_DYNAMIC_TEMPLATE_IDS = {
+    name: template_id
+    for name, template_id in {
+        "verification": settings.SENDGRID_TEMPLATE_VERIFICATION,
+        "password_reset": settings.SENDGRID_TEMPLATE_PASSWORD_RESET,
+        "generation_complete": settings.SENDGRID_TEMPLATE_GENERATION_COMPLETE,
+        "generation_failed": settings.SENDGRID_TEMPLATE_GENERATION_FAILED,
+        "payment_success": settings.SENDGRID_TEMPLATE_PAYMENT_SUCCESS,
+        "payment_failed": settings.SENDGRID_TEMPLATE_PAYMENT_FAILED,
+        "chargeback": settings.SENDGRID_TEMPLATE_CHARGEBACK,
+        "refund": settings.SENDGRID_TEMPLATE_REFUND,
+    }.items()
+    if template_id
+}
+
+
+# Greeting for recipients without a stored name
+_DEFAULT_GREETING = "Hi there,"
+
+
+@lru_cache(maxsize=1024)
+def _name_greeting(user_name: Optional[str]) -> str:
+    """
+    Opening line of an email, personalised when the name is known.
+    Cached so repeat sends to the same user reuse the same string.
+    """
+    return f"Hi {user_name}," if user_name else _DEFAULT_GREETING
+
+
+def render_email(name: str, **context) -> Tuple[str, str]:
+    """Render the (html, text) bodies of a named email template."""
+    templates = _TEMPLATES[name]
+    return templates.html.render(**context), templates.text.render(**context)
+
+
+@lru_cache(maxsize=256)
+def _render_email_cached(name: str, context: Tuple[Tuple[str, Any], ...]) -> Tuple[str, str]:
+    """
+    render_email memoized on the context items. Only for contexts with no
+    personal data, e.g. Stripe emails to users without a stored name.
+    """
+    return render_email(name, **dict(context))
+
+
+@lru_cache(maxsize=256)
+def _render_refund_breakdown(generations_used: int, usage_charge: float, refund_amount: float) -> Tuple[Markup, str]:
+    """
+    Render the (html, text) refund breakdown of a cooling-off refund email.
+    Keyed only on the three numbers, so no recipient details are cached.
+    """
+    context = {
+        "generations_used": generations_used,
+        "usage_charge": usage_charge,
+        "refund_amount": refund_amount
+    }
+    return Markup(_REFUND_BREAKDOWN.html.render(**context)), _REFUND_BREAKDOWN.text.render(**context)
+
+
+class _RetryBudget:
+    """Token bucket limiting how many retries this process may issue."""
+    
+    def __init__(self, capacity: int, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+    
+    def try_acquire(self) -> bool:
+        """Take one retry token if available."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class SendGridUnavailableError(Exception):
+    """Raised instead of calling SendGrid while the circuit breaker is open."""
+
+
+class _CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+    Closed: requests flow. Open: requests are refused until reset_timeout
+    has passed. Half-open: one trial request decides whether to close again;
+    other requests are refused while it is in flight.
+    """
+    
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+    
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+    
+    def allow_request(self) -> bool:
+        """Whether a request may be attempted now (claims the half-open trial)."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "open" or self.trial_in_flight:
+            return False
+        self.trial_in_flight = True
+        return True
+    
+    def release_trial(self) -> None:
+        """Give up the half-open trial without a result (e.g. cancelled send)."""
+        self.trial_in_flight = False
+    
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+    
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit at the threshold."""
+        self.trial_in_flight = False
+        self.failures += 1
+        # A failed trial in half-open re-opens for a full cool-down
+        if self.failures >= self.fail_max or self.opened_at is not None:
+            self.opened_at = time.monotonic()
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to wait before the next attempt: SendGrid's Retry-After if it
+    sent one, otherwise full jitter over the capped exponential backoff.
+    """
+    if retry_after:
+        try:
+            return min(float(retry_after), SENDGRID_BACKOFF_CAP_SECONDS)
+        except ValueError:
+            pass
+    return random.uniform(0, min(SENDGRID_BACKOFF_CAP_SECONDS, SENDGRID_BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+def _build_payload(
+    from_email: str,
+    personalizations: List[Dict[str, Any]],
+    subject: str,
+    html_content: str,
+    text_content: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build a SendGrid v3 mail/send request body."""
+    # SendGrid requires text/plain to come before text/html
+    content = [{"type": "text/html", "value": html_content}]
+    if text_content:
+        content.insert(0, {"type": "text/plain", "value": text_content})
+    return {
+        "personalizations": personalizations,
+        "from": {"email": from_email},
+        "subject": subject,
+        "content": content,
+    }
+
 
 class EmailService:
     """Service for sending emails via SendGrid."""
     
     def __init__(self):
-        """Initialize SendGrid client."""
+        """Initialize SendGrid settings."""
         self.api_key = settings.SENDGRID_API_KEY
         self.from_email = settings.FROM_EMAIL
-        self.client = None
+        self.headers = None
+        # One pooled client per event loop (connections belong to the loop
+        # that opened them); entries go away with their loop
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+        self._retry_budget = _RetryBudget(SENDGRID_RETRY_BUDGET, SENDGRID_RETRY_REFILL_PER_SECOND)
+        self.breaker = _CircuitBreaker(SENDGRID_BREAKER_FAIL_MAX, SENDGRID_BREAKER_RESET_SECONDS)
         
         if self.api_key and self.api_key != "":
+            self.headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+        
+        # Whether a SendGrid API key is available; fixed for the process,
+        # so it is stored once rather than recomputed on every send
+        self.is_configured = self.headers is not None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the pooled HTTP client for the running event loop.
+        Pooled connections are tied to the loop that opened them, so each
+        loop (server, Celery worker, sync-wrapper thread) gets its own.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=SENDGRID_TIMEOUT_SECONDS,
+                limits=SENDGRID_POOL_LIMITS,
+                headers=self.headers
+            )
+            self._clients[loop] = client
+        return client
+    
+    async def startup(self) -> None:
+        """
+        Open the pooled HTTP client on the current loop.
+        Called once per process (FastAPI lifespan, Celery worker init).
+        """
+        if self.is_configured:
+            self._get_client()
+    
+    async def shutdown(self) -> None:
+        """Close this loop's pooled HTTP client (FastAPI shutdown, Celery worker exit)."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+    
+    async def _post(self, payload: dict) -> httpx.Response:
+        """
+        POST a payload to SendGrid through the circuit breaker.
+        Raises SendGridUnavailableError without calling out while it is open.
+        """
+        if not self.breaker.allow_request():
+            raise SendGridUnavailableError("SendGrid circuit breaker is open")
+        
+        try:
+            response = await self._post_with_retries(payload)
+        except httpx.TransportError:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            # No verdict on SendGrid's health; let another request be the trial
+            self.breaker.release_trial()
+            raise
+        
+        if response.status_code >= 500 or response.status_code == 429:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return response
+    
+    async def _post_with_retries(self, payload: dict) -> httpx.Response:
+        """
+        POST a payload to SendGrid, retrying timeouts, connection errors,
+        429 and 502-504 responses while attempts and retry budget remain.
+        """
+        # Serialized once with orjson (bytes, no intermediate str), reused
+        # by every attempt; the client already sends the JSON content type
+        body = orjson.dumps(payload)
+        attempt = 0
+        while True:
             try:
-                self.client = SendGridAPIClient(self.api_key)
-            except Exception as e:
-                logger.error(f"Failed to initialize SendGrid client: {e}")
+                response = await self._get_client().post(SENDGRID_SEND_URL, content=body)
+                if response.status_code not in _RETRYABLE_STATUS_CODES:
+                    return response
+                error = None
+            except httpx.TransportError as e:
+                response = None
+                error = e
+            
+            attempt += 1
+            if attempt >= SENDGRID_MAX_ATTEMPTS or not self._retry_budget.try_acquire():
+                if error is not None:
+                    raise error
+                return response
+            
+            delay = _retry_delay(attempt, response.headers.get("Retry-After") if response is not None else None)
+            reason = response.status_code if response is not None else error
+            logger.warning("SendGrid request failed (%s), retrying in %.2fs (attempt %s/%s)", reason, delay, attempt + 1, SENDGRID_MAX_ATTEMPTS)
+            await asyncio.sleep(delay)
     
     async def send_email(
         self,
@@ -48,44 +471,106 @@ class EmailService:
         Returns:
             True if email sent successfully, False otherwise
         """
-        if not self.client:
-            logger.warning(f"SendGrid not configured. Would send email to {to_email} with subject: {subject}")
-            logger.debug(f"Email content: {html_content}")
+        if not self.is_configured:
+            logger.warning("SendGrid not configured. Would send email to %s with subject: %s", to_email, subject)
+            logger.debug("Email content: %s", html_content)
             return True  # Return True in development/testing
         
         try:
-            # Create message without html_content initially
-            message = Mail(
-                from_email=Email(self.from_email),
-                to_emails=To(to_email),
-                subject=subject
+            payload = _build_payload(
+                self.from_email,
+                [{"to": [{"email": to_email}]}],
+                subject,
+                html_content,
+                text_content
             )
             
-            # Set content properly - either both text and html, or just html
-            if text_content:
-                message.content = [
-                    Content("text/plain", text_content),
-                    Content("text/html", html_content)
-                ]
+            # POST through the pooled async client so the event loop keeps
+            # serving other requests while waiting on SendGrid
+            response = await self._post(payload)
+            
+            if response.status_code in [200, 201, 202]:
+                logger.info("Email sent successfully to %s", to_email)
+                return True
             else:
-                message.content = Content("text/html", html_content)
+                logger.error("Failed to send email to %s. Status: %s, Body: %s", to_email, response.status_code, response.text)
+                return False
+                
+        except SendGridUnavailableError:
+            logger.warning("SendGrid circuit open, not sending email to %s", to_email)
+            return False
+        except Exception as e:
+            logger.error("Error sending email to %s: %s", to_email, e)
+            return False
+    
+    async def send_template_email(
+        self,
+        name: str,
+        to_email: str,
+        subject: str,
+        context: Dict[str, Any],
+        cache_render: bool = False
+    ) -> bool:
+        """
+        Send one of the named emails in EMAIL_TEMPLATE_NAMES.
+        
+        Uses the SendGrid dynamic template when one is configured for it,
+        so the request carries only the template ID and data; otherwise
+        renders the bundled template and sends the full content.
+        
+        Args:
+            name: Template name
+            to_email: Recipient email address
+            subject: Email subject
+            context: Template variables
+            cache_render: Reuse rendered bodies for repeated contexts; only
+                for hashable contexts without names, tokens or personal URLs
             
-            response = self.client.send(message)
+        Returns:
+            True if email sent successfully, False otherwise
+        """
+        template_id = _DYNAMIC_TEMPLATE_IDS.get(name)
+        if template_id:
+            data = {**_SHARED_TEMPLATE_DATA, "subject": subject, **context}
+            return await self._send_dynamic_template(template_id, to_email, data)
+        
+        if cache_render:
+            html_content, text_content = _render_email_cached(name, tuple(context.items()))
+        else:
+            html_content, text_content = render_email(name, **context)
+        return await self.send_email(
+            to_email=to_email,
+            subject=subject,
+            html_content=html_content,
+            text_content=text_content
+        )
+    
+    async def _send_dynamic_template(self, template_id: str, to_email: str, data: Dict[str, Any]) -> bool:
+        """Send an email using a template stored on SendGrid."""
+        if not self.is_configured:
+            logger.warning("SendGrid not configured. Would send template %s to %s", template_id, to_email)
+            return True  # Return True in development/testing
+        
+        try:
+            payload = {
+                "personalizations": [{"to": [{"email": to_email}], "dynamic_template_data": data}],
+                "from": {"email": self.from_email},
+                "template_id": template_id,
+            }
+            response = await self._post(payload)
             
             if response.status_code in [200, 201, 202]:
-                logger.info(f"Email sent successfully to {to_email}")
+                logger.info("Email sent successfully to %s", to_email)
                 return True
             else:
-                logger.error(f"Failed to send email to {to_email}. Status: {response.status_code}, Body: {response.body}")
+                logger.error("Failed to send template %s to %s. Status: %s, Body: %s", template_id, to_email, response.status_code, response.text)
                 return False
                 
+        except SendGridUnavailableError:
+            logger.warning("SendGrid circuit open, not sending template %s to %s", template_id, to_email)
+            return False
         except Exception as e:
-            logger.error(f"Error sending email to {to_email}: {e}")
-            # Log more detailed error information
-            if hasattr(e, 'body'):
-                logger.error(f"SendGrid error details: {e.body}")
-            if hasattr(e, 'to_dict'):
-                logger.error(f"SendGrid error dict: {e.to_dict}")
+            logger.error("Error sending template %s to %s: %s", template_id, to_email, e)
             return False
     
     async def send_verification_email(self, to_email: str, token: str, user_name: Optional[str] = None) -> bool:
@@ -100,81 +585,18 @@ class EmailService:
         Returns:
             True if email sent successfully, False otherwise
         """
-        verification_url = f"{settings.FRONTEND_URL}/verify-email/{token}"
+        verification_url = _VERIFY_URL_PREFIX + token
         
-        name_greeting = f"Hi {user_name}," if user_name else "Hi there,"
+        name_greeting = _name_greeting(user_name)
         
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-                <h1 style="color: white; margin: 0;">Welcome to LLMReady!</h1>
-            </div>
-            
-            <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-                <p style="font-size: 16px;">{name_greeting}</p>
-                
-                <p style="font-size: 16px;">Thank you for registering with LLMReady! To complete your registration and start optimizing your content for AI, please verify your email address.</p>
-                
-                <div style="text-align: center; margin: 30px 0;">
-                    <a href="{verification_url}" 
-                       style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                              color: white; 
-                              padding: 15px 40px; 
-                              text-decoration: none; 
-                              border-radius: 5px; 
-                              font-weight: bold;
-                              display: inline-block;">
-                        Verify Email Address
-                    </a>
-                </div>
-                
-                <p style="font-size: 14px; color: #666;">Or copy and paste this link into your browser:</p>
-                <p style="font-size: 14px; word-break: break-all; background: #fff; padding: 10px; border-radius: 5px;">
-                    {verification_url}
-                </p>
-                
-                <p style="font-size: 14px; color: #666; margin-top: 30px;">
-                    This verification link will expire in 24 hours for security reasons.
-                </p>
-                
-                <p style="font-size: 14px; color: #666;">
-                    If you didn't create an account with LLMReady, you can safely ignore this email.
-                </p>
-            </div>
-            
-            <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-                <p>© 2025 LLMReady. All rights reserved.</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        text_content = f"""
-        {name_greeting}
-        
-        Thank you for registering with LLMReady! To complete your registration, please verify your email address by clicking the link below:
-        
-        {verification_url}
-        
-        This verification link will expire in 24 hours for security reasons.
-        
-        If you didn't create an account with LLMReady, you can safely ignore this email.
-        
-        Best regards,
-        The LLMReady Team
-        """
-        
-        return await self.send_email(
+        return await self.send_template_email(
+            "verification",
             to_email=to_email,
             subject="Verify your LLMReady account",
-            html_content=html_content,
-            text_content=text_content
+            context={
+                "name_greeting": name_greeting,
+                "verification_url": verification_url
+            }
         )
     
     async def send_password_reset_email(self, to_email: str, token: str, user_name: Optional[str] = None) -> bool:
@@ -189,81 +611,18 @@ class EmailService:
         Returns:
             True if email sent successfully, False otherwise
         """
-        reset_url = f"{settings.FRONTEND_URL}/reset-password/{token}"
-        
-        name_greeting = f"Hi {user_name}," if user_name else "Hi there,"
-        
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-                <h1 style="color: white; margin: 0;">Password Reset Request</h1>
-            </div>
-            
-            <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-                <p style="font-size: 16px;">{name_greeting}</p>
-                
-                <p style="font-size: 16px;">We received a request to reset your password for your LLMReady account. Click the button below to create a new password:</p>
-                
-                <div style="text-align: center; margin: 30px 0;">
-                    <a href="{reset_url}" 
-                       style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                              color: white; 
-                              padding: 15px 40px; 
-                              text-decoration: none; 
-                              border-radius: 5px; 
-                              font-weight: bold;
-                              display: inline-block;">
-                        Reset Password
-                    </a>
-                </div>
-                
-                <p style="font-size: 14px; color: #666;">Or copy and paste this link into your browser:</p>
-                <p style="font-size: 14px; word-break: break-all; background: #fff; padding: 10px; border-radius: 5px;">
-                    {reset_url}
-                </p>
-                
-                <p style="font-size: 14px; color: #666; margin-top: 30px;">
-                    This password reset link will expire in 1 hour for security reasons.
-                </p>
-                
-                <p style="font-size: 14px; color: #e74c3c; font-weight: bold;">
-                    If you didn't request a password reset, please ignore this email or contact support if you're concerned about your account security.
-                </p>
-            </div>
-            
-            <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-                <p>© 2025 LLMReady. All rights reserved.</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        text_content = f"""
-        {name_greeting}
+        reset_url = _RESET_URL_PREFIX + token
         
-        We received a request to reset your password for your LLMReady account. Click the link below to create a new password:
+        name_greeting = _name_greeting(user_name)
         
-        {reset_url}
-        
-        This password reset link will expire in 1 hour for security reasons.
-        
-        If you didn't request a password reset, please ignore this email or contact support if you're concerned about your account security.
-        
-        Best regards,
-        The LLMReady Team
-        """
-        
-        return await self.send_email(
+        return await self.send_template_email(
+            "password_reset",
             to_email=to_email,
             subject="Reset your LLMReady password",
-            html_content=html_content,
-            text_content=text_content
+            context={
+                "name_greeting": name_greeting,
+                "reset_url": reset_url
+            }
         )
     
     async def send_generation_complete_email(self, to_email: str, generation_id: str, user_name: Optional[str] = None) -> bool:
@@ -278,70 +637,18 @@ class EmailService:
         Returns:
             True if email sent successfully, False otherwise
         """
-        download_url = f"{settings.FRONTEND_URL}/dashboard/generations/{generation_id}"
+        download_url = _GENERATION_URL_PREFIX + str(generation_id)
         
-        name_greeting = f"Hi {user_name}," if user_name else "Hi there,"
+        name_greeting = _name_greeting(user_name)
         
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-                <h1 style="color: white; margin: 0;">✅ Content Generation Complete!</h1>
-            </div>
-            
-            <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-                <p style="font-size: 16px;">{name_greeting}</p>
-                
-                <p style="font-size: 16px;">Great news! Your LLM-optimized content is ready for download.</p>
-                
-                <div style="text-align: center; margin: 30px 0;">
-                    <a href="{download_url}" 
-                       style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                              color: white; 
-                              padding: 15px 40px; 
-                              text-decoration: none; 
-                              border-radius: 5px; 
-                              font-weight: bold;
-                              display: inline-block;">
-                        Download Your Files
-                    </a>
-                </div>
-                
-                <p style="font-size: 14px; color: #666;">
-                    Your files will be available for download for the next 7 days.
-                </p>
-            </div>
-            
-            <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-                <p>© 2025 LLMReady. All rights reserved.</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        text_content = f"""
-        {name_greeting}
-        
-        Great news! Your LLM-optimized content is ready for download.
-        
-        Download your files here: {download_url}
-        
-        Your files will be available for download for the next 7 days.
-        
-        Best regards,
-        The LLMReady Team
-        """
-        
-        return await self.send_email(
+        return await self.send_template_email(
+            "generation_complete",
             to_email=to_email,
             subject="Your LLMReady content is ready! 🎉",
-            html_content=html_content,
-            text_content=text_content
+            context={
+                "name_greeting": name_greeting,
+                "download_url": download_url
+            }
         )
 
 
@@ -357,78 +664,16 @@ class EmailService:
         Returns:
             True if email sent successfully, False otherwise
         """
-        dashboard_url = f"{settings.FRONTEND_URL}/dashboard"
-        
-        name_greeting = f"Hi {user_name}," if user_name else "Hi there,"
-        
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-                <h1 style="color: white; margin: 0;">⚠️ Content Generation Failed</h1>
-            </div>
-            
-            <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-                <p style="font-size: 16px;">{name_greeting}</p>
-                
-                <p style="font-size: 16px;">Unfortunately, your content generation encountered an error and couldn't be completed.</p>
-                
-                {f'<p style="font-size: 14px; color: #666; background: #fff; padding: 10px; border-left: 3px solid #e74c3c; border-radius: 3px;"><strong>Error:</strong> {error_message}</p>' if error_message else ''}
-                
-                <p style="font-size: 14px; color: #666;">
-                    Don't worry - this hasn't counted against your usage quota. You can try again from your dashboard.
-                </p>
-                
-                <div style="text-align: center; margin: 30px 0;">
-                    <a href="{dashboard_url}"
-                       style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                              color: white;
-                              padding: 15px 40px;
-                              text-decoration: none;
-                              border-radius: 5px;
-                              font-weight: bold;
-                              display: inline-block;">
-                        Go to Dashboard
-                    </a>
-                </div>
-                
-                <p style="font-size: 14px; color: #666;">
-                    If this problem persists, please contact our support team.
-                </p>
-            </div>
-            
-            <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-                <p>© 2025 LLMReady. All rights reserved.</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        text_content = f"""
-        {name_greeting}
+        name_greeting = _name_greeting(user_name)
         
-        Unfortunately, your content generation encountered an error and couldn't be completed.
-        
-        {f'Error: {error_message}' if error_message else ''}
-        
-        Don't worry - this hasn't counted against your usage quota. You can try again from your dashboard: {dashboard_url}
-        
-        If this problem persists, please contact our support team.
-        
-        Best regards,
-        The LLMReady Team
-        """
-        
-        return await self.send_email(
+        return await self.send_template_email(
+            "generation_failed",
             to_email=to_email,
             subject="Generation failed - LLMReady",
-            html_content=html_content,
-            text_content=text_content
+            context={
+                "name_greeting": name_greeting,
+                "error_message": error_message
+            }
         )
     async def send_cooling_off_refund_email(
         self,
@@ -451,127 +696,20 @@ class EmailService:
         Returns:
             True if email sent successfully
         """
-        name_greeting = f"Hi {user_name}," if user_name else "Hi there,"
-        
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-                <h1 style="color: white; margin: 0;">💰 14-Day Refund Processed</h1>
-            </div>
-            
-            <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-                <p style="font-size: 16px;">{name_greeting}</p>
-                
-                <p style="font-size: 16px;">We've processed your subscription cancellation within the 14-day cooling-off period as per EU regulations.</p>
-                
-                <div style="background: #fff; padding: 20px; border-radius: 8px; margin: 20px 0; border: 1px solid #e5e7eb;">
-                    <h3 style="margin-top: 0; color: #667eea;">Refund Breakdown</h3>
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr style="border-bottom: 1px solid #e5e7eb;">
-                            <td style="padding: 12px 0; color: #666;">Generations Created:</td>
-                            <td style="padding: 12px 0; text-align: right; font-weight: bold;">
-                                {generations_used}
-                            </td>
-                        </tr>
-                        <tr style="border-bottom: 1px solid #e5e7eb;">
-                            <td style="padding: 12px 0; color: #666;">Usage Charge:</td>
-                            <td style="padding: 12px 0; text-align: right; font-weight: bold; color: #e74c3c;">
-                                -€{usage_charge:.2f}
-                            </td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 16px 0 0 0; font-size: 18px; font-weight: bold;">Refund Amount:</td>
-                            <td style="padding: 16px 0 0 0; text-align: right; font-weight: bold; font-size: 20px; color: #10b981;">
-                                €{refund_amount:.2f}
-                            </td>
-                        </tr>
-                    </table>
-                </div>
-                
-                <div style="background: #eff6ff; padding: 15px; border-radius: 5px; border-left: 4px solid #3b82f6; margin: 20px 0;">
-                    <p style="margin: 0; font-size: 14px; color: #1e40af;">
-                        <strong>Refund Timeline:</strong> 5-10 business days to your original payment method
-                    </p>
-                </div>
-                
-                <p style="font-size: 14px; color: #666;">
-                    Your account has been downgraded to the <strong>Free plan</strong>. You can still:
-                </p>
-                <ul style="font-size: 14px; color: #666;">
-                    <li>Create 1 website</li>
-                    <li>Generate 1 llms.txt file per month</li>
-                    <li>Access all your existing data</li>
-                </ul>
-                
-                <p style="font-size: 14px; color: #666;">
-                    We'd love to hear why you're leaving. Your feedback helps us improve!
-                </p>
-                
-                <div style="text-align: center; margin: 30px 0;">
-                    <a href="{settings.FRONTEND_URL}/dashboard"
-                       style="background: #f3f4f6;
-                              color: #667eea;
-                              padding: 12px 30px;
-                              text-decoration: none;
-                              border-radius: 5px;
-                              font-weight: bold;
-                              display: inline-block;
-                              border: 2px solid #667eea;">
-                        Go to Dashboard
-                    </a>
-                </div>
-                
-                <p style="font-size: 12px; color: #999; margin-top: 30px; padding-top: 20px; border-top: 1px solid #e5e7eb;">
-                    <strong>EU Consumer Rights:</strong> This refund was processed under EU Consumer Rights Directive (2011/83/EU) - 14-day cooling-off period.
-                </p>
-            </div>
-            
-            <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-                <p>© 2025 LLMReady. All rights reserved.</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        text_content = f"""
-        {name_greeting}
-        
-        We've processed your subscription cancellation within the 14-day cooling-off period as per EU regulations.
-        
-        REFUND BREAKDOWN:
-        ------------------
-        Generations Created: {generations_used}
-        Usage Charge: -€{usage_charge:.2f}
-        Refund Amount: €{refund_amount:.2f}
-        
-        Refund Timeline: 5-10 business days to your original payment method
-        
-        Your account has been downgraded to the Free plan. You can still:
-        - Create 1 website
-        - Generate 1 llms.txt file per month
-        - Access all your existing data
-        
-        We'd love to hear why you're leaving. Your feedback helps us improve!
-        
-        Dashboard: {settings.FRONTEND_URL}/dashboard
-        
-        EU Consumer Rights: This refund was processed under EU Consumer Rights Directive (2011/83/EU) - 14-day cooling-off period.
-        
-        Best regards,
-        The LLMReady Team
-        """
+        name_greeting = _name_greeting(user_name)
+        refund_breakdown, refund_breakdown_text = _render_refund_breakdown(
+            generations_used, usage_charge, refund_amount
+        )
         
-        return await self.send_email(
+        return await self.send_template_email(
+            "cooling_off_refund",
             to_email=to_email,
             subject="Refund Processed - 14-Day Cooling-Off Period",
-            html_content=html_content,
-            text_content=text_content
+            context={
+                "name_greeting": name_greeting,
+                "refund_breakdown": refund_breakdown,
+                "refund_breakdown_text": refund_breakdown_text
+            }
         )
 
     async def send_contact_form_email(
@@ -596,62 +734,16 @@ class EmailService:
         # Send to support email (FROM_EMAIL or a dedicated support email)
         support_email = self.from_email  # Or settings.SUPPORT_EMAIL if you add one
         
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-                <h1 style="color: white; margin: 0;">📧 New Contact Form Submission</h1>
-            </div>
-            
-            <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-                <div style="background: #fff; padding: 20px; border-radius: 5px; margin-bottom: 20px;">
-                    <p style="margin: 0; font-size: 14px; color: #666;">From</p>
-                    <p style="margin: 5px 0 0 0; font-size: 16px; font-weight: bold;">{from_name}</p>
-                    <p style="margin: 5px 0 0 0; font-size: 14px; color: #667eea;">{from_email}</p>
-                </div>
-                
-                <div style="background: #fff; padding: 20px; border-radius: 5px; margin-bottom: 20px;">
-                    <p style="margin: 0; font-size: 14px; color: #666;">Subject</p>
-                    <p style="margin: 5px 0 0 0; font-size: 16px; font-weight: bold;">{subject}</p>
-                </div>
-                
-                <div style="background: #fff; padding: 20px; border-radius: 5px;">
-                    <p style="margin: 0; font-size: 14px; color: #666;">Message</p>
-                    <p style="margin: 10px 0 0 0; font-size: 14px; white-space: pre-wrap;">{message}</p>
-                </div>
-                
-                <p style="font-size: 12px; color: #999; margin-top: 20px; text-align: center;">
-                    Reply to this person at: {from_email}
-                </p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        text_content = f"""
-        New Contact Form Submission
-        
-        From: {from_name}
-        Email: {from_email}
-        Subject: {subject}
-        
-        Message:
-        {message}
-        
-        ---
-        Reply to: {from_email}
-        """
-        
-        return await self.send_email(
+        return await self.send_template_email(
+            "contact_form",
             to_email=support_email,
             subject=f"Contact Form: {subject}",
-            html_content=html_content,
-            text_content=text_content
+            context={
+                "from_name": from_name,
+                "from_email": from_email,
+                "subject": subject,
+                "message": message
+            }
         )
 
 
@@ -659,6 +751,77 @@ class EmailService:
 # Global email service instance
 email_service = EmailService()
 
+# Event loop for the synchronous wrappers, one per thread: reused across
+# calls so the pooled SendGrid client survives between tasks, and never
+# shared between threads (a loop can only run in one thread at a time)
+_thread_state = threading.local()
+
+# Strong references to sends scheduled from inside a running loop, so they
+# aren't garbage collected before they finish
+_background_sends: set = set()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Return this thread's loop for synchronous sends, creating it if needed."""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _new_event_loop()
+        _thread_state.loop = loop
+    return loop
+
+
+def _log_send_errors(task: asyncio.Task) -> None:
+    """Done callback for scheduled sends: log failures nobody awaits."""
+    _background_sends.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background email send failed", exc_info=task.exception())
+
+
+def schedule_email(coro) -> asyncio.Task:
+    """
+    Schedule an email coroutine on the running loop without awaiting it.
+    For async endpoints that can respond before SendGrid has replied.
+    """
+    task = asyncio.get_running_loop().create_task(coro)
+    _background_sends.add(task)
+    task.add_done_callback(_log_send_errors)
+    return task
+
+
+def run_sync(coro) -> bool:
+    """
+    Run an email coroutine from synchronous code.
+    
+    Celery tasks have no running loop, so the send runs to completion on the
+    calling thread's loop. Sync webhook handlers are called from inside the async
+    endpoint's loop, where blocking on it is impossible; there the send is
+    scheduled on that loop and True is returned straight away.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _get_sync_loop().run_until_complete(coro)
+    
+    schedule_email(coro)
+    return True
+
+
+@worker_process_init.connect
+def _init_worker_loop(**kwargs) -> None:
+    """Give each forked Celery worker process its own loop and SendGrid pool."""
+    _thread_state.loop = _new_event_loop()
+    _thread_state.loop.run_until_complete(email_service.startup())
+
+
+@worker_process_shutdown.connect
+def _close_worker_loop(**kwargs) -> None:
+    """Close the pooled SendGrid client and the loop when a worker exits."""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is not None and not loop.is_closed():
+        loop.run_until_complete(email_service.shutdown())
+        loop.close()
+    _thread_state.loop = None
+
 
 # Synchronous wrapper functions for Celery tasks
 def send_generation_complete_email(to_email: str, user_name: str, website_name: str, generation_id: str) -> bool:
@@ -666,14 +829,7 @@ def send_generation_complete_email(to_email: str, user_name: str, website_name:
     Synchronous wrapper for sending generation complete email.
     Used by Celery tasks which don't support async.
     """
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(
+    return run_sync(
         email_service.send_generation_complete_email(to_email, generation_id, user_name)
     )
 
@@ -683,14 +839,7 @@ def send_generation_failed_email(to_email: str, user_name: str, error_message: s
     Synchronous wrapper for sending generation failed email.
     Used by Celery tasks which don't support async.
     """
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(
+    return run_sync(
         email_service.send_generation_failed_email(to_email, user_name, error_message)
     )
 
@@ -700,6 +849,8 @@ def increment_generation_usage(db: any, user_id: any) -> None:
     Helper function to increment generation usage.
     Used by Celery tasks.
     """
+    # Imported here so loading the email service (eagerly, via the webhooks router)
+    # doesn't pull in the subscription service, models and Stripe
     from app.services.subscription import SubscriptionService
     service = SubscriptionService(db)
     service.increment_usage(user_id)
@@ -727,119 +878,20 @@ async def send_subscription_payment_email_async(
         next_billing_date: Date of next renewal
         features: List of plan features
     """
-    name_greeting = f"Hi {user_name}," if user_name else "Hi there,"
+    name_greeting = _name_greeting(user_name)
     
-    features_html = "".join([
-        f'<li style="padding: 5px 0;">{feature}</li>'
-        for feature in features
-    ])
-    
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background: linear-gradient(135deg, #10b981 0%, #059669 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-            <h1 style="color: white; margin: 0;">🎉 Payment Successful!</h1>
-        </div>
-        
-        <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-            <p style="font-size: 16px;">{name_greeting}</p>
-            
-            <p style="font-size: 16px;">Thank you for your payment! Your <strong>{plan_name}</strong> subscription is now active.</p>
-            
-            <!-- Payment Summary -->
-            <div style="background: #fff; padding: 25px; border-radius: 8px; margin: 25px 0; border: 2px solid #10b981;">
-                <h3 style="margin-top: 0; color: #667eea; font-size: 18px;">Payment Summary</h3>
-                <table style="width: 100%; border-collapse: collapse;">
-                    <tr style="border-bottom: 1px solid #e5e7eb;">
-                        <td style="padding: 12px 0; color: #666;">Plan:</td>
-                        <td style="padding: 12px 0; text-align: right; font-weight: bold;">{plan_name} ({billing_interval.title()})</td>
-                    </tr>
-                    <tr style="border-bottom: 1px solid #e5e7eb;">
-                        <td style="padding: 12px 0; color: #666;">Amount Paid:</td>
-                        <td style="padding: 12px 0; text-align: right; font-weight: bold; color: #10b981;">€{amount_paid:.2f}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 12px 0; color: #666;">Next Billing:</td>
-                        <td style="padding: 12px 0; text-align: right; font-weight: bold;">{next_billing_date}</td>
-                    </tr>
-                </table>
-            </div>
-            
-            <!-- Plan Features -->
-            <div style="background: #fff; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                <h3 style="margin-top: 0; color: #667eea; font-size: 16px;">Your {plan_name} Plan Includes:</h3>
-                <ul style="font-size: 14px; color: #666; margin: 0; padding-left: 20px;">
-                    {features_html}
-                </ul>
-            </div>
-            
-            <div style="background: #eff6ff; padding: 15px; border-radius: 5px; border-left: 4px solid #3b82f6; margin: 20px 0;">
-                <p style="margin: 0; font-size: 14px; color: #1e40af;">
-                    <strong>📧 Invoice:</strong> A detailed invoice has been sent to your email and is available in your Stripe customer portal.
-                </p>
-            </div>
-            
-            <div style="text-align: center; margin: 30px 0;">
-                <a href="{settings.FRONTEND_URL}/dashboard"
-                   style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                          color: white;
-                          padding: 15px 40px;
-                          text-decoration: none;
-                          border-radius: 5px;
-                          font-weight: bold;
-                          display: inline-block;">
-                    Go to Dashboard
-                </a>
-            </div>
-            
-            <p style="font-size: 12px; color: #999; text-align: center; margin-top: 20px;">
-                Questions? Contact us at {settings.FROM_EMAIL}
-            </p>
-        </div>
-        
-        <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-            <p>© 2025 LLMReady. All rights reserved.</p>
-        </div>
-    </body>
-    </html>
-    """
-    
-    features_text = "\n".join([f"  • {feature}" for feature in features])
-    
-    text_content = f"""
-    {name_greeting}
-    
-    Thank you for your payment! Your {plan_name} subscription is now active.
-    
-    PAYMENT SUMMARY
-    ---------------
-    Plan: {plan_name} ({billing_interval.title()})
-    Amount Paid: €{amount_paid:.2f}
-    Next Billing: {next_billing_date}
-    
-    YOUR {plan_name.upper()} PLAN INCLUDES:
-    {features_text}
-    
-    📧 Invoice: A detailed invoice has been sent to your email and is available in your Stripe customer portal.
-    
-    Dashboard: {settings.FRONTEND_URL}/dashboard
-    
-    Questions? Contact us at {settings.FROM_EMAIL}
-    
-    Best regards,
-    The LLMReady Team
-    """
-    
-    return await email_service.send_email(
+    return await email_service.send_template_email(
+        "subscription_payment",
         to_email=to_email,
         subject=f"Payment Confirmed - {plan_name} Plan Active! 🎉",
-        html_content=html_content,
-        text_content=text_content
+        context={
+            "name_greeting": name_greeting,
+            "plan_name": plan_name,
+            "amount_paid": amount_paid,
+            "billing_interval": billing_interval,
+            "next_billing_date": next_billing_date,
+            "features": features
+        }
     )
 
 
@@ -853,14 +905,7 @@ def send_subscription_payment_email(
     features: list
 ) -> bool:
     """Synchronous wrapper for subscription payment email."""
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(
+    return run_sync(
         send_subscription_payment_email_async(
             to_email, user_name, plan_name, amount_paid,
             billing_interval, next_billing_date, features
@@ -868,477 +913,101 @@ def send_subscription_payment_email(
     )
 
 # Stripe-related email functions
-async def send_payment_success_email_async(to_email: str, amount_paid: float, user_name: Optional[str] = None) -> bool:
-    """Send payment success confirmation email."""
-    name_greeting = f"Hi {user_name}," if user_name else "Hi there,"
-    
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background: linear-gradient(135deg, #10b981 0%, #059669 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-            <h1 style="color: white; margin: 0;">✅ Payment Successful!</h1>
-        </div>
-        
-        <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-            <p style="font-size: 16px;">{name_greeting}</p>
-            
-            <p style="font-size: 16px;">Thank you for your payment! Your subscription is now active.</p>
-            
-            <div style="background: #fff; padding: 20px; border-radius: 5px; margin: 20px 0;">
-                <p style="margin: 0; font-size: 14px; color: #666;">Amount Paid</p>
-                <p style="margin: 5px 0 0 0; font-size: 24px; font-weight: bold; color: #10b981;">€{amount_paid:.2f}</p>
-            </div>
-            
-            <p style="font-size: 14px; color: #666;">
-                Your subscription will automatically renew at the end of your billing period.
-            </p>
-            
-            <div style="text-align: center; margin: 30px 0;">
-                <a href="{settings.FRONTEND_URL}/dashboard"
-                   style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                          color: white;
-                          padding: 15px 40px;
-                          text-decoration: none;
-                          border-radius: 5px;
-                          font-weight: bold;
-                          display: inline-block;">
-                    Go to Dashboard
-                </a>
-            </div>
-        </div>
-        
-        <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-            <p>© 2025 LLMReady. All rights reserved.</p>
-        </div>
-    </body>
-    </html>
-    """
-    
-    text_content = f"""
-    {name_greeting}
-    
-    Thank you for your payment! Your subscription is now active.
-    
-    Amount Paid: €{amount_paid:.2f}
-    
-    Your subscription will automatically renew at the end of your billing period.
-    
-    Dashboard: {settings.FRONTEND_URL}/dashboard
-    
-    Best regards,
-    The LLMReady Team
-    """
-    
-    return await email_service.send_email(
+# Subjects of the fixed-subject Stripe emails, by template name
+_STRIPE_EMAIL_SUBJECTS = {
+    "payment_success": "Payment successful - LLMReady",
+    "payment_failed": "Action required: Payment failed - LLMReady",
+    "chargeback": "Chargeback received - LLMReady",
+    "refund": "Refund processed - LLMReady",
+    "payment_action_required": "Authentication required for payment - LLMReady",
+    "subscription_canceled": "Subscription canceled - LLMReady",
+}
+
+# Stripe emails whose rendered bodies are never memoized (per-invoice URLs)
+_UNCACHED_STRIPE_EMAILS = frozenset({"payment_action_required"})
+
+
+async def _send_stripe_email(name: str, to_email: str, user_name: Optional[str], **context) -> bool:
+    """Send one of the Stripe emails in _STRIPE_EMAIL_SUBJECTS."""
+    return await email_service.send_template_email(
+        name,
         to_email=to_email,
-        subject="Payment successful - LLMReady",
-        html_content=html_content,
-        text_content=text_content
+        subject=_STRIPE_EMAIL_SUBJECTS[name],
+        context={"name_greeting": _name_greeting(user_name), **context},
+        # Only anonymous renders are memoized, so no names are cached; the
+        # action-required email carries a per-invoice payment URL
+        cache_render=not user_name and name not in _UNCACHED_STRIPE_EMAILS
     )
 
 
+async def send_payment_success_email_async(to_email: str, amount_paid: float, user_name: Optional[str] = None) -> bool:
+    """Send payment success confirmation email."""
+    return await _send_stripe_email("payment_success", to_email, user_name, amount_paid=amount_paid)
+
+
 async def send_payment_failed_email_async(to_email: str, user_name: Optional[str] = None) -> bool:
     """Send payment failure notification email."""
-    name_greeting = f"Hi {user_name}," if user_name else "Hi there,"
-    
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-            <h1 style="color: white; margin: 0;">⚠️ Payment Failed</h1>
-        </div>
-        
-        <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-            <p style="font-size: 16px;">{name_greeting}</p>
-            
-            <p style="font-size: 16px;">We were unable to process your payment. This may be due to:</p>
-            
-            <ul style="font-size: 14px; color: #666;">
-                <li>Insufficient funds</li>
-                <li>Expired card</li>
-                <li>Incorrect card details</li>
-                <li>Bank decline</li>
-            </ul>
-            
-            <p style="font-size: 14px; color: #666;">
-                Your subscription will remain active for a grace period of 3 days. Please update your payment method to avoid service interruption.
-            </p>
-            
-            <div style="text-align: center; margin: 30px 0;">
-                <a href="{settings.FRONTEND_URL}/dashboard?action=update_payment"
-                   style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                          color: white;
-                          padding: 15px 40px;
-                          text-decoration: none;
-                          border-radius: 5px;
-                          font-weight: bold;
-                          display: inline-block;">
-                    Update Payment Method
-                </a>
-            </div>
-        </div>
-        
-        <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-            <p>© 2025 LLMReady. All rights reserved.</p>
-        </div>
-    </body>
-    </html>
-    """
-    
-    text_content = f"""
-    {name_greeting}
-    
-    We were unable to process your payment. This may be due to insufficient funds, an expired card, incorrect card details, or a bank decline.
-    
-    Your subscription will remain active for a grace period of 3 days. Please update your payment method to avoid service interruption.
-    
-    Update Payment Method: {settings.FRONTEND_URL}/dashboard?action=update_payment
-    
-    Best regards,
-    The LLMReady Team
-    """
-    
-    return await email_service.send_email(
-        to_email=to_email,
-        subject="Action required: Payment failed - LLMReady",
-        html_content=html_content,
-        text_content=text_content
-    )
+    return await _send_stripe_email("payment_failed", to_email, user_name)
 
 
 async def send_chargeback_email_async(to_email: str, user_name: Optional[str] = None) -> bool:
     """Send chargeback notification email."""
-    name_greeting = f"Hi {user_name}," if user_name else "Hi there,"
-    
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-            <h1 style="color: white; margin: 0;">⚠️ Chargeback Received</h1>
-        </div>
-        
-        <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-            <p style="font-size: 16px;">{name_greeting}</p>
-            
-            <p style="font-size: 16px;">We've received a chargeback for your payment. Your subscription has been canceled and your account has been downgraded to the free plan.</p>
-            
-            <p style="font-size: 14px; color: #666;">
-                If you believe this was done in error, please contact our support team immediately.
-            </p>
-        </div>
-        
-        <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-            <p>© 2025 LLMReady. All rights reserved.</p>
-        </div>
-    </body>
-    </html>
-    """
-    
-    text_content = f"""
-    {name_greeting}
-    
-    We've received a chargeback for your payment. Your subscription has been canceled and your account has been downgraded to the free plan.
-    
-    If you believe this was done in error, please contact our support team immediately.
-    
-    Best regards,
-    The LLMReady Team
-    """
-    
-    return await email_service.send_email(
-        to_email=to_email,
-        subject="Chargeback received - LLMReady",
-        html_content=html_content,
-        text_content=text_content
-    )
+    return await _send_stripe_email("chargeback", to_email, user_name)
 
 
 async def send_refund_email_async(to_email: str, amount_refunded: float, user_name: Optional[str] = None) -> bool:
     """Send refund confirmation email."""
-    name_greeting = f"Hi {user_name}," if user_name else "Hi there,"
-    
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-            <h1 style="color: white; margin: 0;">💰 Refund Processed</h1>
-        </div>
-        
-        <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-            <p style="font-size: 16px;">{name_greeting}</p>
-            
-            <p style="font-size: 16px;">A refund has been processed for your subscription.</p>
-            
-            <div style="background: #fff; padding: 20px; border-radius: 5px; margin: 20px 0;">
-                <p style="margin: 0; font-size: 14px; color: #666;">Refund Amount</p>
-                <p style="margin: 5px 0 0 0; font-size: 24px; font-weight: bold; color: #667eea;">€{amount_refunded:.2f}</p>
-            </div>
-            
-            <p style="font-size: 14px; color: #666;">
-                The refund should appear in your account within 5-10 business days, depending on your bank. Your subscription has been canceled and your account has been downgraded to the free plan.
-            </p>
-        </div>
-        
-        <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-            <p>© 2025 LLMReady. All rights reserved.</p>
-        </div>
-    </body>
-    </html>
-    """
-    
-    text_content = f"""
-    {name_greeting}
-    
-    A refund has been processed for your subscription.
-    
-    Refund Amount: €{amount_refunded:.2f}
-    
-    The refund should appear in your account within 5-10 business days, depending on your bank. Your subscription has been canceled and your account has been downgraded to the free plan.
-    
-    Best regards,
-    The LLMReady Team
-    """
-    
-    return await email_service.send_email(
-        to_email=to_email,
-        subject="Refund processed - LLMReady",
-        html_content=html_content,
-        text_content=text_content
-    )
+    return await _send_stripe_email("refund", to_email, user_name, amount_refunded=amount_refunded)
 
 
 async def send_payment_action_required_email_async(to_email: str, hosted_invoice_url: str, user_name: Optional[str] = None) -> bool:
     """Send payment action required email (3D Secure)."""
-    name_greeting = f"Hi {user_name}," if user_name else "Hi there,"
-    
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-            <h1 style="color: white; margin: 0;">🔐 Authentication Required</h1>
-        </div>
-        
-        <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-            <p style="font-size: 16px;">{name_greeting}</p>
-            
-            <p style="font-size: 16px;">Your bank requires additional authentication to complete your payment (3D Secure).</p>
-            
-            <p style="font-size: 14px; color: #666;">
-                Please complete the authentication process to activate your subscription.
-            </p>
-            
-            <div style="text-align: center; margin: 30px 0;">
-                <a href="{hosted_invoice_url}"
-                   style="background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
-                          color: white;
-                          padding: 15px 40px;
-                          text-decoration: none;
-                          border-radius: 5px;
-                          font-weight: bold;
-                          display: inline-block;">
-                    Complete Authentication
-                </a>
-            </div>
-        </div>
-        
-        <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-            <p>© 2025 LLMReady. All rights reserved.</p>
-        </div>
-    </body>
-    </html>
-    """
-    
-    text_content = f"""
-    {name_greeting}
-    
-    Your bank requires additional authentication to complete your payment (3D Secure).
-    
-    Please complete the authentication process to activate your subscription: {hosted_invoice_url}
-    
-    Best regards,
-    The LLMReady Team
-    """
-    
-    return await email_service.send_email(
-        to_email=to_email,
-        subject="Authentication required for payment - LLMReady",
-        html_content=html_content,
-        text_content=text_content
-    )
+    return await _send_stripe_email("payment_action_required", to_email, user_name, hosted_invoice_url=hosted_invoice_url)
 
 
 async def send_subscription_canceled_email_async(to_email: str, user_name: Optional[str] = None) -> bool:
     """Send subscription cancellation confirmation email."""
-    name_greeting = f"Hi {user_name}," if user_name else "Hi there,"
-    
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-            <h1 style="color: white; margin: 0;">Subscription Canceled</h1>
-        </div>
-        
-        <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-            <p style="font-size: 16px;">{name_greeting}</p>
-            
-            <p style="font-size: 16px;">Your subscription has been canceled. Your account has been downgraded to the free plan.</p>
-            
-            <p style="font-size: 14px; color: #666;">
-                We're sorry to see you go! You can resubscribe at any time from your dashboard.
-            </p>
-            
-            <div style="text-align: center; margin: 30px 0;">
-                <a href="{settings.FRONTEND_URL}/pricing"
-                   style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                          color: white;
-                          padding: 15px 40px;
-                          text-decoration: none;
-                          border-radius: 5px;
-                          font-weight: bold;
-                          display: inline-block;">
-                    View Plans
-                </a>
-            </div>
-        </div>
-        
-        <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-            <p>© 2025 LLMReady. All rights reserved.</p>
-        </div>
-    </body>
-    </html>
-    """
-    
-    text_content = f"""
-    {name_greeting}
-    
-    Your subscription has been canceled. Your account has been downgraded to the free plan.
-    
-    We're sorry to see you go! You can resubscribe at any time from your dashboard.
-    
-    View Plans: {settings.FRONTEND_URL}/pricing
-    
-    Best regards,
-    The LLMReady Team
-    """
-    
-    return await email_service.send_email(
-        to_email=to_email,
-        subject="Subscription canceled - LLMReady",
-        html_content=html_content,
-        text_content=text_content
-    )
+    return await _send_stripe_email("subscription_canceled", to_email, user_name)
 
 
 # Synchronous wrappers for Celery/webhook handlers
 def send_payment_success_email(to_email: str, amount_paid: float, user_name: Optional[str] = None) -> bool:
     """Synchronous wrapper for payment success email."""
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(
+    return run_sync(
         send_payment_success_email_async(to_email, amount_paid, user_name)
     )
 
 
 def send_payment_failed_email(to_email: str, user_name: Optional[str] = None) -> bool:
     """Synchronous wrapper for payment failed email."""
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(
+    return run_sync(
         send_payment_failed_email_async(to_email, user_name)
     )
 
 
 def send_chargeback_email(to_email: str, user_name: Optional[str] = None) -> bool:
     """Synchronous wrapper for chargeback email."""
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(
+    return run_sync(
         send_chargeback_email_async(to_email, user_name)
     )
 
 
 def send_refund_email(to_email: str, amount_refunded: float, user_name: Optional[str] = None) -> bool:
     """Synchronous wrapper for refund email."""
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(
+    return run_sync(
         send_refund_email_async(to_email, amount_refunded, user_name)
     )
 
 
 def send_payment_action_required_email(to_email: str, hosted_invoice_url: str, user_name: Optional[str] = None) -> bool:
     """Synchronous wrapper for payment action required email."""
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(
+    return run_sync(
         send_payment_action_required_email_async(to_email, hosted_invoice_url, user_name)
     )
 
 
 def send_subscription_canceled_email(to_email: str, user_name: Optional[str] = None) -> bool:
     """Synchronous wrapper for subscription canceled email."""
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(
+    return run_sync(
         send_subscription_canceled_email_async(to_email, user_name)
-    )
\ No newline at end of file
+    )
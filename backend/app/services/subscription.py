@@ -3,6 +3,7 @@ Subscription service for managing Stripe subscriptions and quotas.
 """
 import stripe
 import logging
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 from uuid import UUID
@@ -27,6 +28,12 @@ from app.schemas.subscription import (
 stripe.api_key = settings.STRIPE_SECRET_KEY
 
 
+@lru_cache(maxsize=16)
+def get_plan_info_model(plan_type: str) -> PlanInfo:
+    """Return the (immutable, shared) PlanInfo for a plan type."""
+    return PlanInfo(**get_plan_info(plan_type))
+
+
 class SubscriptionService:
     """Service for managing subscriptions and Stripe integration."""
     
@@ -274,19 +281,6 @@ class SubscriptionService:
         if not subscription:
             raise ValueError("No subscription found for user")
         
-        # Get plan info
-        plan_info = get_plan_info(subscription.plan_type)
-        
-        # Calculate remaining generations
-        remaining = max(0, subscription.generations_limit - subscription.generations_used)
-        
-        # Calculate usage percentage
-        usage_pct = (
-            (subscription.generations_used / subscription.generations_limit * 100)
-            if subscription.generations_limit > 0
-            else 0
-        )
-        
         return SubscriptionInfo(
             id=subscription.id,
             user_id=subscription.user_id,
@@ -302,9 +296,9 @@ class SubscriptionService:
             max_websites=subscription.websites_limit,
             created_at=subscription.created_at,
             updated_at=subscription.updated_at,
-            remaining_generations=remaining,
-            usage_percentage=round(usage_pct, 2),
-            plan_info=PlanInfo(**plan_info)
+            remaining_generations=subscription.remaining_generations,
+            usage_percentage=subscription.usage_percentage,
+            plan_info=get_plan_info_model(subscription.plan_type)
         )
     
     def get_usage_stats(self, user: User) -> UsageStats:
@@ -326,22 +320,12 @@ class SubscriptionService:
         from app.models.website import Website
         website_count = self.db.query(func.count(Website.id)).filter(Website.user_id == user.id).scalar()
         
-        # Calculate remaining generations
-        remaining = max(0, subscription.generations_limit - subscription.generations_used)
-        
-        # Calculate usage percentage
-        usage_pct = (
-            (subscription.generations_used / subscription.generations_limit * 100)
-            if subscription.generations_limit > 0
-            else 0
-        )
-        
         return UsageStats(
             current_plan=subscription.plan_type,
             generations_used=subscription.generations_used,
             generations_limit=subscription.generations_limit,
-            remaining_generations=remaining,
-            usage_percentage=round(usage_pct, 2),
+            remaining_generations=subscription.remaining_generations,
+            usage_percentage=subscription.usage_percentage,
             websites_count=website_count or 0,
             max_websites=subscription.websites_limit,
             period_start=subscription.current_period_start,
@@ -9,10 +9,12 @@ from app.tasks.scheduled import (
     cleanup_old_generations,
     sync_stripe_subscriptions
 )
+from app.tasks.email import send_email_task
 
 __all__ = [
     'generate_llm_content',
     'reset_monthly_quotas',
     'cleanup_old_generations',
-    'sync_stripe_subscriptions'
+    'sync_stripe_subscriptions',
+    'send_email_task'
 ]
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+Celery tasks for email delivery.
+Moves SendGrid round-trips off the request path so endpoints like signup
+and password reset return without waiting on email.
+"""
+import asyncio
+import logging
+from typing import Any, Dict
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.celery_app import celery_app
+from app.services.email import (
+    email_service,
+    run_sync,
+    send_subscription_payment_email_async,
+    send_payment_success_email_async,
+    send_payment_failed_email_async,
+    send_chargeback_email_async,
+    send_refund_email_async,
+    send_payment_action_required_email_async,
+    send_subscription_canceled_email_async
+)
+
+logger = logging.getLogger(__name__)
+
+# Emails that can be queued, by kind
+EMAIL_SENDERS = {
+    "verification": email_service.send_verification_email,
+    "password_reset": email_service.send_password_reset_email,
+    # Stripe webhook emails
+    "subscription_payment": send_subscription_payment_email_async,
+    "payment_success": send_payment_success_email_async,
+    "payment_failed": send_payment_failed_email_async,
+    "chargeback": send_chargeback_email_async,
+    "refund": send_refund_email_async,
+    "payment_action_required": send_payment_action_required_email_async,
+    "subscription_canceled": send_subscription_canceled_email_async,
+}
+
+# Seconds a broker publish may take before the email is sent inline instead
+EMAIL_PUBLISH_TIMEOUT_SECONDS = 2.0
+
+
+class EmailDeliveryError(Exception):
+    """Raised when SendGrid did not accept an email, so Celery retries it."""
+
+
+@celery_app.task(
+    bind=True,
+    autoretry_for=(EmailDeliveryError,),
+    retry_backoff=True,
+    retry_backoff_max=60,
+    retry_jitter=True,
+    max_retries=5
+)
+def send_email_task(self, kind: str, kwargs: Dict[str, Any]) -> bool:
+    """
+    Render and send one email in the background.
+
+    Args:
+        kind: Key into EMAIL_SENDERS
+        kwargs: Keyword arguments for that sender
+    """
+    if not run_sync(EMAIL_SENDERS[kind](**kwargs)):
+        raise EmailDeliveryError(f"Failed to send {kind} email to {kwargs.get('to_email')}")
+    return True
+
+
+def _publish(kind: str, kwargs: Dict[str, Any]) -> None:
+    """
+    Publish send_email_task to the broker (blocking).
+    Connection retries are disabled so an unreachable broker fails within
+    EMAIL_PUBLISH_TIMEOUT_SECONDS and callers fall back to sending inline.
+    """
+    send_email_task.apply_async(
+        args=(kind, kwargs),
+        retry=False,
+        timeout=EMAIL_PUBLISH_TIMEOUT_SECONDS
+    )
+
+
+def _publish_or_send(kind: str, kwargs: Dict[str, Any]) -> bool:
+    """Queue an email, or send it on this thread if the broker is unavailable (blocking)."""
+    try:
+        _publish(kind, kwargs)
+        return True
+    except Exception as e:
+        logger.warning("Could not queue %s email, sending inline: %s", kind, e)
+        return run_sync(EMAIL_SENDERS[kind](**kwargs))
+
+
+async def queue_email(kind: str, **kwargs) -> bool:
+    """
+    Queue an email for background delivery.
+    The broker publish runs in the threadpool so a slow broker never stalls
+    the event loop; falls back to sending inline if it can't be reached.
+    """
+    try:
+        await run_in_threadpool(_publish, kind, kwargs)
+        return True
+    except Exception as e:
+        logger.warning("Could not queue %s email, sending inline: %s", kind, e)
+        return await EMAIL_SENDERS[kind](**kwargs)
+
+
+# Publishes handed to the executor by enqueue_email, kept until they finish
+_pending_enqueues: set = set()
+
+
+def _log_enqueue_errors(future: asyncio.Future) -> None:
+    """Done callback for enqueue_email: log failures nobody awaits."""
+    _pending_enqueues.discard(future)
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Background email enqueue failed", exc_info=future.exception())
+
+
+def enqueue_email(kind: str, **kwargs) -> bool:
+    """
+    Queue an email for background delivery from sync code (e.g. webhook handlers).
+    
+    Sync webhook handlers run inside the async endpoint's loop, so there the
+    publish (and any inline fallback send) is handed to the loop's default
+    executor and True is returned straight away. Without a running loop,
+    e.g. in Celery tasks, it runs on the calling thread.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _publish_or_send(kind, kwargs)
+    
+    future = loop.run_in_executor(None, _publish_or_send, kind, kwargs)
+    _pending_enqueues.add(future)
+    future.add_done_callback(_log_enqueue_errors)
+    return True
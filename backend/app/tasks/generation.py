@@ -12,6 +12,8 @@ from datetime import datetime
 from typing import Optional
 import logging
 
+from sqlalchemy import func, update
+
 from app.core.celery_app import celery_app
 from app.core.database import SessionLocal
 from app.models.generation import Generation
@@ -287,9 +289,9 @@ def generate_llm_content(self, generation_id: str):
         success, duration, error_msg = run_mdream_crawler(
             origin=website.url,
             out_dir=temp_dir,
-            include=website.include_patterns,
-            exclude=website.exclude_patterns,
-            use_playwright=website.use_playwright_bool,
+            include=','.join(website.include_patterns) if website.include_patterns else None,
+            exclude=','.join(website.exclude_patterns) if website.exclude_patterns else None,
+            use_playwright=website.use_playwright,
             max_pages=website.max_pages,
             timeout=website.timeout
         )
@@ -331,9 +333,17 @@ def generate_llm_content(self, generation_id: str):
         generation.total_pages = total_pages
         generation.progress_percentage = 100
         
-        # Update website metadata
-        website.last_generated_at = datetime.utcnow()
-        website.generation_count += 1
+        # Update website metadata in a single atomic UPDATE (no read-modify-write,
+        # so concurrent generations for the same website can't lose an increment)
+        db.execute(
+            update(Website)
+            .where(Website.id == website.id)
+            .values(
+                generation_count=Website.generation_count + 1,
+                last_generated_at=func.now()
+            )
+            .execution_options(synchronize_session=False)
+        )
         
         db.commit()
         
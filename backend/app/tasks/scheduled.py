@@ -6,6 +6,8 @@ import logging
 import stripe
 from datetime import datetime, timedelta
 
+from sqlalchemy import update
+
 from app.core.celery_app import celery_app
 from app.core.database import SessionLocal
 from app.core.config import settings
@@ -147,6 +149,10 @@ def sync_stripe_subscriptions():
         sync_count = 0
         error_count = 0
         
+        # Changes are collected and written in one executemany UPDATE by
+        # primary key instead of one flushed UPDATE per subscription
+        updates = []
+        
         for sub in pending_subscriptions:
             try:
                 # Fetch current status from Stripe
@@ -154,21 +160,26 @@ def sync_stripe_subscriptions():
                 
                 # Check if status differs
                 if stripe_sub.status != sub.status:
-                    old_status = sub.status
-                    sub.status = stripe_sub.status
-                    
                     # Update period dates if changed
-                    if stripe_sub.current_period_start:
-                        sub.current_period_start = datetime.fromtimestamp(stripe_sub.current_period_start)
-                    if stripe_sub.current_period_end:
-                        sub.current_period_end = datetime.fromtimestamp(stripe_sub.current_period_end)
-                    
-                    sub.cancel_at_period_end = stripe_sub.cancel_at_period_end
-                    sub.updated_at = datetime.utcnow()
+                    updates.append({
+                        "id": sub.id,
+                        "status": stripe_sub.status,
+                        "current_period_start": (
+                            datetime.fromtimestamp(stripe_sub.current_period_start)
+                            if stripe_sub.current_period_start
+                            else sub.current_period_start
+                        ),
+                        "current_period_end": (
+                            datetime.fromtimestamp(stripe_sub.current_period_end)
+                            if stripe_sub.current_period_end
+                            else sub.current_period_end
+                        ),
+                        "cancel_at_period_end": stripe_sub.cancel_at_period_end,
+                    })
                     
                     logger.info(
                         f"Synced subscription {sub.id} from Stripe: "
-                        f"{old_status} -> {stripe_sub.status}"
+                        f"{sub.status} -> {stripe_sub.status}"
                     )
                     sync_count += 1
             
@@ -179,6 +190,9 @@ def sync_stripe_subscriptions():
                 logger.error(f"Failed to sync subscription {sub.id}: {e}")
                 error_count += 1
         
+        if updates:
+            # updated_at is set by the column's onupdate
+            db.execute(update(Subscription), updates)
         db.commit()
         
         result = {
@@ -0,0 +1,11 @@
+"""
+Pagination helpers shared by the list endpoints.
+"""
+
+
+def page_count(total: int, per_page: int) -> int:
+    """
+    Number of pages needed for total items, at least 1.
+    Uses integer ceil-division, so no float conversion or math.ceil call.
+    """
+    return -(-total // per_page) or 1
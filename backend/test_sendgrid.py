@@ -4,14 +4,18 @@ Run this to verify your SendGrid setup is working correctly.
 """
 import os
 import sys
+import httpx
 from dotenv import load_dotenv
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail, Email, To, Content
 
 # Load environment variables
 load_dotenv()
 
-def test_sendgrid():
+# SendGrid v3 Mail Send endpoint (same one the app posts to)
+SENDGRID_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+
+# Named check_* rather than test_* so pytest doesn't collect this
+# interactive script as a test
+def check_sendgrid():
     """Test SendGrid configuration and send a test email."""
     
     print("=" * 60)
@@ -40,12 +44,11 @@ def test_sendgrid():
     
     # Test SendGrid connection
     print(f"\n2. Testing SendGrid connection...")
-    try:
-        sg = SendGridAPIClient(api_key)
-        print("   ✓ SendGrid client initialized")
-    except Exception as e:
-        print(f"   ✗ Failed to initialize SendGrid client: {e}")
-        return False
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
+    print("   ✓ SendGrid request headers prepared")
     
     # Prompt for test email
     print(f"\n3. Sending test email...")
@@ -57,11 +60,7 @@ def test_sendgrid():
     
     # Create and send test email
     try:
-        message = Mail(
-            from_email=Email(from_email),
-            to_emails=To(test_recipient),
-            subject='SendGrid Test Email - LLMReady',
-            html_content=Content("text/html", """
+        html_content = """
                 <html>
                 <body style="font-family: Arial, sans-serif; padding: 20px;">
                     <h2 style="color: #667eea;">✅ SendGrid is Working!</h2>
@@ -77,10 +76,15 @@ def test_sendgrid():
                     </p>
                 </body>
                 </html>
-            """)
-        )
+            """
+        payload = {
+            "personalizations": [{"to": [{"email": test_recipient}]}],
+            "from": {"email": from_email},
+            "subject": "SendGrid Test Email - LLMReady",
+            "content": [{"type": "text/html", "value": html_content}]
+        }
         
-        response = sg.send(message)
+        response = httpx.post(SENDGRID_SEND_URL, headers=headers, json=payload, timeout=10.0)
         
         if response.status_code in [200, 201, 202]:
             print(f"   ✓ Test email sent successfully!")
@@ -91,32 +95,30 @@ def test_sendgrid():
         else:
             print(f"   ✗ Failed to send test email")
             print(f"   Status code: {response.status_code}")
-            print(f"   Response: {response.body}")
-            return False
+            print(f"   Response: {response.text}")
+            error_str = f"{response.status_code} {response.text}".lower()
             
-    except Exception as e:
+    except httpx.HTTPError as e:
         print(f"   ✗ Error sending test email: {e}")
-        if hasattr(e, 'body'):
-            print(f"   Error details: {e.body}")
-        
-        # Common error messages
-        error_str = str(e).lower()
-        if 'from email' in error_str or 'sender' in error_str:
-            print(f"\n💡 Common Fix:")
-            print(f"   Your FROM_EMAIL ({from_email}) is not verified in SendGrid.")
-            print(f"   Go to: https://app.sendgrid.com/settings/sender_auth/senders")
-            print(f"   And verify this email address.")
-        elif 'unauthorized' in error_str or '401' in error_str:
-            print(f"\n💡 Common Fix:")
-            print(f"   Your API key is invalid or doesn't have Mail Send permission.")
-            print(f"   Create a new API key with 'Mail Send - Full Access':")
-            print(f"   https://app.sendgrid.com/settings/api_keys")
-        
         return False
+    
+    # Common error messages
+    if 'from email' in error_str or 'sender' in error_str:
+        print(f"\n💡 Common Fix:")
+        print(f"   Your FROM_EMAIL ({from_email}) is not verified in SendGrid.")
+        print(f"   Go to: https://app.sendgrid.com/settings/sender_auth/senders")
+        print(f"   And verify this email address.")
+    elif 'unauthorized' in error_str or '401' in error_str:
+        print(f"\n💡 Common Fix:")
+        print(f"   Your API key is invalid or doesn't have Mail Send permission.")
+        print(f"   Create a new API key with 'Mail Send - Full Access':")
+        print(f"   https://app.sendgrid.com/settings/api_keys")
+    
+    return False
 
 def main():
     """Run the test."""
-    success = test_sendgrid()
+    success = check_sendgrid()
     
     print("\n" + "=" * 60)
     if success:
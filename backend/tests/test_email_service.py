@@ -0,0 +1,236 @@
+"""
+Tests for the httpx-based SendGrid email service.
+SendGrid is replaced by an httpx.MockTransport; no network calls are made.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import orjson
+import pytest
+
+from app.core.config import settings
+from app.services import email as email_module
+from app.services.email import (
+    EMAIL_TEMPLATE_NAMES,
+    SENDGRID_BREAKER_FAIL_MAX,
+    SENDGRID_BREAKER_RESET_SECONDS,
+    SENDGRID_SEND_URL,
+    EmailService,
+    _CircuitBreaker,
+    _RetryBudget,
+    render_email,
+)
+
+
+class _Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze time.monotonic as seen by the email service (not the event loop)."""
+    fake = _Clock()
+    monkeypatch.setattr(email_module, "time", SimpleNamespace(monotonic=fake))
+    return fake
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry backoff delays instead of sleeping."""
+    delays = []
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr(email_module.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def _configured_service(monkeypatch, handler) -> EmailService:
+    """
+    EmailService with an API key whose client for the running loop
+    routes every request to handler.
+    """
+    monkeypatch.setattr(settings, "SENDGRID_API_KEY", "SG.test-key")
+    service = EmailService()
+    service._clients[asyncio.get_running_loop()] = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        headers=service.headers
+    )
+    return service
+
+
+class TestSendGridRetries:
+    """Retry behaviour of EmailService._post_with_retries"""
+    
+    @pytest.mark.asyncio
+    async def test_retries_after_429_honouring_retry_after(self, monkeypatch, sleeps):
+        """A 429 with Retry-After is retried after that delay, then succeeds"""
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            if len(requests) == 1:
+                return httpx.Response(429, headers={"Retry-After": "1"})
+            return httpx.Response(202)
+        
+        service = _configured_service(monkeypatch, handler)
+        
+        sent = await service.send_email("user@example.com", "Subject", "<p>Hi</p>", "Hi")
+        
+        assert sent == True
+        assert len(requests) == 2
+        assert sleeps == [1.0]
+        assert str(requests[0].url) == SENDGRID_SEND_URL
+        assert requests[0].headers["Authorization"] == "Bearer SG.test-key"
+        payload = orjson.loads(requests[1].content)
+        assert payload["personalizations"] == [{"to": [{"email": "user@example.com"}]}]
+        assert service.breaker.state == "closed"
+    
+    @pytest.mark.asyncio
+    async def test_stops_retrying_when_budget_is_exhausted(self, monkeypatch, sleeps, clock):
+        """With one retry token left, a failing send makes only two attempts"""
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(503)
+        
+        service = _configured_service(monkeypatch, handler)
+        service._retry_budget = _RetryBudget(capacity=1, refill_per_second=0.0)
+        
+        sent = await service.send_email("user@example.com", "Subject", "<p>Hi</p>")
+        
+        assert sent == False
+        assert len(requests) == 2
+        assert len(sleeps) == 1
+        assert service._retry_budget.try_acquire() == False
+
+
+class TestCircuitBreaker:
+    """State transitions of _CircuitBreaker"""
+    
+    def test_closed_open_half_open_closed(self, clock):
+        """Failures open the circuit, the cool-down half-opens it, a success closes it"""
+        breaker = _CircuitBreaker(fail_max=3, reset_timeout=30.0)
+        assert breaker.state == "closed"
+        
+        for _ in range(3):
+            assert breaker.allow_request() == True
+            breaker.record_failure()
+        
+        assert breaker.state == "open"
+        assert breaker.allow_request() == False
+        
+        clock.now += 30.0
+        assert breaker.state == "half_open"
+        
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.failures == 0
+    
+    def test_half_open_allows_a_single_trial(self, clock):
+        """Only one request is let through while the half-open trial is in flight"""
+        breaker = _CircuitBreaker(fail_max=1, reset_timeout=30.0)
+        breaker.record_failure()
+        clock.now += 30.0
+        
+        assert breaker.allow_request() == True
+        assert breaker.allow_request() == False
+        
+        breaker.release_trial()
+        assert breaker.allow_request() == True
+    
+    def test_failed_trial_reopens_for_full_cooldown(self, clock):
+        """A failed half-open trial re-opens the circuit for another reset_timeout"""
+        breaker = _CircuitBreaker(fail_max=1, reset_timeout=30.0)
+        breaker.record_failure()
+        clock.now += 30.0
+        
+        assert breaker.allow_request() == True
+        breaker.record_failure()
+        
+        assert breaker.state == "open"
+        clock.now += 29.0
+        assert breaker.state == "open"
+        clock.now += 1.0
+        assert breaker.state == "half_open"
+    
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_sendgrid(self, monkeypatch, sleeps, clock):
+        """Once SENDGRID_BREAKER_FAIL_MAX sends fail, no request reaches SendGrid until the cool-down ends"""
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(500)
+        
+        service = _configured_service(monkeypatch, handler)
+        
+        for _ in range(SENDGRID_BREAKER_FAIL_MAX):
+            assert await service.send_email("user@example.com", "Subject", "<p>Hi</p>") == False
+        
+        assert service.breaker.state == "open"
+        sent_before = len(requests)
+        
+        assert await service.send_email("user@example.com", "Subject", "<p>Hi</p>") == False
+        assert len(requests) == sent_before
+        
+        clock.now += SENDGRID_BREAKER_RESET_SECONDS
+        assert service.breaker.state == "half_open"
+
+
+# One context covering the variables of every bundled template
+_TEMPLATE_CONTEXT = {
+    "name_greeting": "Hi Test User,",
+    "verification_url": "https://example.com/verify-email?token=abc",
+    "reset_url": "https://example.com/reset-password?token=abc",
+    "download_url": "https://example.com/dashboard/generations/1",
+    "dashboard_url": "https://example.com/dashboard",
+    "pricing_url": "https://example.com/pricing",
+    "update_payment_url": "https://example.com/dashboard/billing",
+    "hosted_invoice_url": "https://invoice.stripe.com/i/test",
+    "error_message": "Website could not be crawled",
+    "refund_breakdown": "<p>Refund: €15.00</p>",
+    "refund_breakdown_text": "Refund: €15.00",
+    "from_name": "Test User",
+    "from_email": "test@example.com",
+    "subject": "Question",
+    "message": "Hello <b>there</b>",
+    "plan_name": "Standard",
+    "billing_interval": "month",
+    "amount_paid": 15.0,
+    "amount_refunded": 15.0,
+    "next_billing_date": "January 1, 2027",
+    "features": ["10 generations per month"],
+    "support_email": "support@example.com",
+}
+
+
+class TestEmailTemplates:
+    """Rendering of the bundled email templates"""
+    
+    @pytest.mark.parametrize("name", EMAIL_TEMPLATE_NAMES)
+    def test_render_email(self, name):
+        """Every named template renders non-empty HTML and text bodies"""
+        html, text = render_email(name, **_TEMPLATE_CONTEXT)
+        
+        assert html.strip()
+        assert text.strip()
+        if name != "contact_form":
+            assert "Hi Test User," in html
+            assert "Hi Test User," in text
+    
+    def test_contact_form_html_is_escaped(self):
+        """User-supplied contact form fields are autoescaped in the HTML body"""
+        html, text = render_email("contact_form", **_TEMPLATE_CONTEXT)
+        
+        assert "Hello &lt;b&gt;there&lt;/b&gt;" in html
+        assert "Hello <b>there</b>" in text
@@ -124,8 +124,9 @@ class TestErrorHandling:
 class TestPaymentSuccessHandler:
     """Test P0 Fix #3: Payment success handler"""
     
-    @patch('app.services.email.send_payment_success_email')
-    def test_handle_payment_succeeded_activates_subscription(self, mock_email, db_session):
+    @patch('app.api.v1.webhooks.stripe.Subscription.retrieve', return_value={})
+    @patch('app.api.v1.webhooks.enqueue_email')
+    def test_handle_payment_succeeded_activates_subscription(self, mock_enqueue, mock_retrieve, db_session):
         """Payment success should activate subscription"""
         user = User(
             id=uuid4(),
@@ -155,7 +156,11 @@ class TestPaymentSuccessHandler:
         
         db_session.refresh(subscription)
         assert subscription.status == "active"
-        assert mock_email.called
+        mock_enqueue.assert_called_once()
+        args, kwargs = mock_enqueue.call_args
+        assert args == ("subscription_payment",)
+        assert kwargs["to_email"] == "test@example.com"
+        assert kwargs["amount_paid"] == 15.0
 
 
 class TestGracePeriod:
@@ -217,8 +222,8 @@ class TestGracePeriod:
 class TestChargebackHandler:
     """Test P0 Fix #5: Chargeback/dispute handling"""
     
-    @patch('app.services.email.send_chargeback_email')
-    def test_handle_charge_disputed_revokes_access(self, mock_email, db_session):
+    @patch('app.api.v1.webhooks.enqueue_email')
+    def test_handle_charge_disputed_revokes_access(self, mock_enqueue, db_session):
         """Chargeback should immediately revoke access"""
         user = User(id=uuid4(), email="test@example.com", password_hash="hash", full_name="Test User")
         db_session.add(user)
@@ -244,14 +249,16 @@ class TestChargebackHandler:
         db_session.refresh(subscription)
         assert subscription.status == "canceled"
         assert subscription.plan_type == "free"
-        assert mock_email.called
+        mock_enqueue.assert_called_once_with(
+            "chargeback", to_email="test@example.com", user_name="Test User"
+        )
 
 
 class TestRefundHandler:
     """Test P0 Fix #7: Refund handling"""
     
-    @patch('app.services.email.send_refund_email')
-    def test_handle_charge_refunded_downgrades_account(self, mock_email, db_session):
+    @patch('app.api.v1.webhooks.enqueue_email')
+    def test_handle_charge_refunded_downgrades_account(self, mock_enqueue, db_session):
         """Full refund should downgrade to free"""
         user = User(id=uuid4(), email="test@example.com", password_hash="hash", full_name="Test User")
         db_session.add(user)
@@ -278,7 +285,9 @@ class TestRefundHandler:
         db_session.refresh(subscription)
         assert subscription.plan_type == "free"
         assert subscription.status == "canceled"
-        assert mock_email.called
+        mock_enqueue.assert_called_once_with(
+            "refund", to_email="test@example.com", amount_refunded=15.0, user_name="Test User"
+        )
 
 
 class TestQuotaOverflow:
@@ -152,8 +152,8 @@ export default function WebsitesPage() {
     setValue('url', website.url)
     setValue('name', website.name)
     setValue('description', website.description || '')
-    setValue('include_patterns', website.include_patterns || '')
-    setValue('exclude_patterns', website.exclude_patterns || '')
+    setValue('include_patterns', website.include_patterns?.join(', ') || '')
+    setValue('exclude_patterns', website.exclude_patterns?.join(', ') || '')
     setValue('max_pages', website.max_pages)
     setValue('use_playwright', website.use_playwright)
     setValue('timeout', website.timeout)
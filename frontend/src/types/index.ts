@@ -57,8 +57,8 @@ export interface Website {
   url: string
   name: string
   description: string | null
-  include_patterns: string | null
-  exclude_patterns: string | null
+  include_patterns: string[] | null
+  exclude_patterns: string[] | null
   max_pages: number
   use_playwright: boolean
   timeout: number
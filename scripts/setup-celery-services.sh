@@ -27,6 +27,7 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 echo -e "${BLUE}1️⃣  Copying service files...${NC}"
 
 cp "$SCRIPT_DIR/llmready-celery-worker.service" /etc/systemd/system/
+cp "$SCRIPT_DIR/llmready-celery-email.service" /etc/systemd/system/
 cp "$SCRIPT_DIR/llmready-celery-beat.service" /etc/systemd/system/
 
 echo -e "${GREEN}✅ Service files copied${NC}\n"
@@ -50,6 +51,7 @@ echo -e "${GREEN}✅ Systemd reloaded${NC}\n"
 echo -e "${BLUE}4️⃣  Enabling services...${NC}"
 
 systemctl enable llmready-celery-worker
+systemctl enable llmready-celery-email
 systemctl enable llmready-celery-beat
 
 echo -e "${GREEN}✅ Services enabled (will start on boot)${NC}\n"
@@ -58,6 +60,7 @@ echo -e "${GREEN}✅ Services enabled (will start on boot)${NC}\n"
 echo -e "${BLUE}5️⃣  Starting services...${NC}"
 
 systemctl start llmready-celery-worker
+systemctl start llmready-celery-email
 systemctl start llmready-celery-beat
 
 echo -e "${GREEN}✅ Services started${NC}\n"
@@ -71,6 +74,12 @@ else
     echo -e "${RED}❌ Celery Worker: NOT RUNNING${NC}"
 fi
 
+if systemctl is-active --quiet llmready-celery-email; then
+    echo -e "${GREEN}✅ Celery Email Worker: RUNNING${NC}"
+else
+    echo -e "${RED}❌ Celery Email Worker: NOT RUNNING${NC}"
+fi
+
 if systemctl is-active --quiet llmready-celery-beat; then
     echo -e "${GREEN}✅ Celery Beat: RUNNING${NC}"
 else
@@ -84,8 +93,10 @@ echo -e "${BLUE}========================================${NC}\n"
 
 echo -e "${BLUE}📝 Useful Commands:${NC}"
 echo -e "  View worker logs:  ${YELLOW}sudo journalctl -u llmready-celery-worker -f${NC}"
+echo -e "  View email logs:   ${YELLOW}sudo journalctl -u llmready-celery-email -f${NC}"
 echo -e "  View beat logs:    ${YELLOW}sudo journalctl -u llmready-celery-beat -f${NC}"
 echo -e "  Restart worker:    ${YELLOW}sudo systemctl restart llmready-celery-worker${NC}"
+echo -e "  Restart email:     ${YELLOW}sudo systemctl restart llmready-celery-email${NC}"
 echo -e "  Restart beat:      ${YELLOW}sudo systemctl restart llmready-celery-beat${NC}"
 echo -e "  Check status:      ${YELLOW}sudo systemctl status llmready-celery-worker${NC}"
 echo ""
\ No newline at end of file
@@ -22,6 +22,7 @@ cat > /etc/sudoers.d/llmready-deploy << EOF
 # LLMReady deployment permissions for $DEPLOY_USER
 $DEPLOY_USER ALL=(ALL) NOPASSWD: /bin/systemctl restart llmready-backend
 $DEPLOY_USER ALL=(ALL) NOPASSWD: /bin/systemctl restart llmready-celery-worker
+$DEPLOY_USER ALL=(ALL) NOPASSWD: /bin/systemctl restart llmready-celery-email
 $DEPLOY_USER ALL=(ALL) NOPASSWD: /bin/systemctl restart llmready-celery-beat
 $DEPLOY_USER ALL=(ALL) NOPASSWD: /bin/systemctl reload nginx
 $DEPLOY_USER ALL=(ALL) NOPASSWD: /bin/systemctl daemon-reload